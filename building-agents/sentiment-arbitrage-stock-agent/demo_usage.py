@@ -10,44 +10,97 @@ This script demonstrates:
 """
 
 from src.signal_generator import SignalGenerator
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List
+import numpy as np
+import orjson
+import sys
+import yfinance as yf
+
+
+# Banner strings are constant, so build them once at import time
+_BAR = "=" * 70
+_STAR = "*" * 70
+_BLANK = "*" + " " * 68 + "*"
+_HDR = "*" + "  TRADING SIGNAL SERVICE - COMPREHENSIVE DEMONSTRATION".center(68) + "*"
+_FOOTER = "*" + "  ALL DEMONSTRATIONS COMPLETED SUCCESSFULLY".center(68) + "*"
+
+# Integer codes for bincount-based signal summaries, in display order
+_SIGNAL_CODES = {"BUY": 0, "HOLD": 1, "NEUTRAL": 2}
+
+
+def _get_generator(
+    sentiment_threshold: float = 0.7,
+    rsi_buy_threshold: float = 30,
+    rsi_period: int = 14
+) -> SignalGenerator:
+    """Return a shared SignalGenerator for the given configuration."""
+    # Normalize to positional args so keyword and default calls share a cache entry
+    return _cached_generator(sentiment_threshold, rsi_buy_threshold, rsi_period)
+
+
+@lru_cache(maxsize=8)
+def _cached_generator(
+    sentiment_threshold: float,
+    rsi_buy_threshold: float,
+    rsi_period: int
+) -> SignalGenerator:
+    return SignalGenerator(sentiment_threshold, rsi_buy_threshold, rsi_period)
+
+
+def write_lines(lines: List[str]):
+    """Write buffered output lines to stdout in a single call and clear the buffer."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
+
+
+def format_section(title: str) -> List[str]:
+    """Build the lines of a formatted section header."""
+    return ["\n" + _BAR, f"  {title}", _BAR]
 
 
 def print_section(title: str):
     """Print a formatted section header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
-
-
-def print_signal_result(result: dict):
-    """Print signal result in a formatted way."""
-    print(f"\nSignal Type: {result['signal']}")
-    print(f"Ticker: {result['ticker']}")
-    print(f"Status: {result['status']}")
-    print(f"\nMetrics:")
-    print(f"  Sentiment Score: {result['sentiment_score']} (0=negative, 1=positive)")
-    print(f"  RSI: {result['rsi']} (0-100, <30=oversold, >70=overbought)")
-    print(f"  Volume: {result['volume']:,}" if result['volume'] else "  Volume: N/A")
-    print(f"  Price: ${result['price']}" if result['price'] else "  Price: N/A")
-    print(f"\nReason:")
-    print(f"  {result['reason']}")
-    print(f"\nSentiment Details:")
-    print(f"  Posts Analyzed: {result['metadata']['sentiment_details']['num_posts']}")
-    print(f"  Valid Posts: {result['metadata']['sentiment_details']['valid_posts']}")
-    print(f"  Raw Polarity: {result['metadata']['sentiment_details']['raw_polarity']}")
-
-    if result['errors']:
-        print(f"\nErrors:")
-        for error in result['errors']:
-            print(f"  [{error['type']}] {error['message']}")
+    write_lines(format_section(title))
+
+
+def format_signal_result(result: dict) -> List[str]:
+    """Build the lines of a formatted signal result."""
+    lines = []
+    volume = result['volume']
+    price = result['price']
+    details = result['metadata']['sentiment_details']
+    errors = result['errors']
+
+    lines.append(f"\nSignal Type: {result['signal']}")
+    lines.append(f"Ticker: {result['ticker']}")
+    lines.append(f"Status: {result['status']}")
+    lines.append(f"\nMetrics:")
+    lines.append(f"  Sentiment Score: {result['sentiment_score']} (0=negative, 1=positive)")
+    lines.append(f"  RSI: {result['rsi']} (0-100, <30=oversold, >70=overbought)")
+    lines.append(f"  Volume: {volume:,}" if volume else "  Volume: N/A")
+    lines.append(f"  Price: ${price}" if price else "  Price: N/A")
+    lines.append(f"\nReason:")
+    lines.append(f"  {result['reason']}")
+    lines.append(f"\nSentiment Details:")
+    lines.append(f"  Posts Analyzed: {details['num_posts']}")
+    lines.append(f"  Valid Posts: {details['valid_posts']}")
+    lines.append(f"  Raw Polarity: {details['raw_polarity']}")
+
+    if errors:
+        lines.append(f"\nErrors:")
+        for error in errors:
+            lines.append(f"  [{error['type']}] {error['message']}")
+
+    return lines
 
 
 def demo_buy_signal():
     """Demonstrate a BUY signal scenario."""
-    print_section("Example 1: BUY Signal - High Sentiment + Oversold RSI")
+    lines = format_section("Example 1: BUY Signal - High Sentiment + Oversold RSI")
 
-    generator = SignalGenerator(
+    generator = _get_generator(
         sentiment_threshold=0.7,
         rsi_buy_threshold=30,
         rsi_period=14
@@ -62,32 +115,35 @@ def demo_buy_signal():
         "Apple services revenue is phenomenal, very bullish"
     ]
 
-    print(f"\nInput:")
-    print(f"  Ticker: {ticker}")
-    print(f"  Reddit Posts: {len(reddit_posts)} highly positive comments")
-    print(f"\nSample posts:")
+    lines.append(f"\nInput:")
+    lines.append(f"  Ticker: {ticker}")
+    lines.append(f"  Reddit Posts: {len(reddit_posts)} highly positive comments")
+    lines.append(f"\nSample posts:")
     for i, post in enumerate(reddit_posts[:3], 1):
-        print(f"  {i}. \"{post}\"")
+        lines.append(f"  {i}. \"{post}\"")
 
-    print(f"\nGenerating signal...")
+    lines.append(f"\nGenerating signal...")
+    write_lines(lines)
     result = generator.generate_signal(ticker, reddit_posts)
-    print_signal_result(result)
+    lines.extend(format_signal_result(result))
 
-    print(f"\nInterpretation:")
+    lines.append(f"\nInterpretation:")
     if result['signal'] == 'BUY':
-        print(f"  This is a STRONG BUY signal because:")
-        print(f"  - High positive sentiment ({result['sentiment_score']}) indicates market enthusiasm")
-        print(f"  - Low RSI ({result['rsi']}) suggests the stock is oversold")
-        print(f"  - Combination of both factors suggests a potential buying opportunity")
+        lines.append(f"  This is a STRONG BUY signal because:")
+        lines.append(f"  - High positive sentiment ({result['sentiment_score']}) indicates market enthusiasm")
+        lines.append(f"  - Low RSI ({result['rsi']}) suggests the stock is oversold")
+        lines.append(f"  - Combination of both factors suggests a potential buying opportunity")
+
+    write_lines(lines)
 
     return result
 
 
 def demo_hold_signal():
     """Demonstrate a HOLD signal scenario."""
-    print_section("Example 2: HOLD Signal - Positive Sentiment but RSI Not Oversold")
+    lines = format_section("Example 2: HOLD Signal - Positive Sentiment but RSI Not Oversold")
 
-    generator = SignalGenerator(
+    generator = _get_generator(
         sentiment_threshold=0.7,
         rsi_buy_threshold=30,
         rsi_period=14
@@ -100,29 +156,32 @@ def demo_hold_signal():
         "Jensen Huang is incredible, bullish on NVDA"
     ]
 
-    print(f"\nInput:")
-    print(f"  Ticker: {ticker}")
-    print(f"  Reddit Posts: {len(reddit_posts)} positive comments")
+    lines.append(f"\nInput:")
+    lines.append(f"  Ticker: {ticker}")
+    lines.append(f"  Reddit Posts: {len(reddit_posts)} positive comments")
 
-    print(f"\nGenerating signal...")
+    lines.append(f"\nGenerating signal...")
+    write_lines(lines)
     result = generator.generate_signal(ticker, reddit_posts)
-    print_signal_result(result)
+    lines.extend(format_signal_result(result))
 
-    print(f"\nInterpretation:")
+    lines.append(f"\nInterpretation:")
     if result['signal'] == 'HOLD':
-        print(f"  This is a HOLD signal because:")
-        print(f"  - Sentiment is positive, showing market interest")
-        print(f"  - But RSI is not oversold, so no clear entry point")
-        print(f"  - Consider waiting for a better technical setup")
+        lines.append(f"  This is a HOLD signal because:")
+        lines.append(f"  - Sentiment is positive, showing market interest")
+        lines.append(f"  - But RSI is not oversold, so no clear entry point")
+        lines.append(f"  - Consider waiting for a better technical setup")
+
+    write_lines(lines)
 
     return result
 
 
 def demo_neutral_signal():
     """Demonstrate a NEUTRAL signal scenario."""
-    print_section("Example 3: NEUTRAL Signal - Low Sentiment")
+    lines = format_section("Example 3: NEUTRAL Signal - Low Sentiment")
 
-    generator = SignalGenerator(
+    generator = _get_generator(
         sentiment_threshold=0.7,
         rsi_buy_threshold=30,
         rsi_period=14
@@ -135,55 +194,61 @@ def demo_neutral_signal():
         "MSFT has some issues with competition"
     ]
 
-    print(f"\nInput:")
-    print(f"  Ticker: {ticker}")
-    print(f"  Reddit Posts: {len(reddit_posts)} neutral/negative comments")
+    lines.append(f"\nInput:")
+    lines.append(f"  Ticker: {ticker}")
+    lines.append(f"  Reddit Posts: {len(reddit_posts)} neutral/negative comments")
 
-    print(f"\nGenerating signal...")
+    lines.append(f"\nGenerating signal...")
+    write_lines(lines)
     result = generator.generate_signal(ticker, reddit_posts)
-    print_signal_result(result)
+    lines.extend(format_signal_result(result))
 
-    print(f"\nInterpretation:")
+    lines.append(f"\nInterpretation:")
     if result['signal'] == 'NEUTRAL':
-        print(f"  This is a NEUTRAL signal because:")
-        print(f"  - Sentiment is not strong enough to justify entry")
-        print(f"  - No clear trading opportunity at this time")
-        print(f"  - Consider monitoring for changes in sentiment or technicals")
+        lines.append(f"  This is a NEUTRAL signal because:")
+        lines.append(f"  - Sentiment is not strong enough to justify entry")
+        lines.append(f"  - No clear trading opportunity at this time")
+        lines.append(f"  - Consider monitoring for changes in sentiment or technicals")
+
+    write_lines(lines)
 
     return result
 
 
 def demo_empty_posts():
     """Demonstrate handling of empty posts."""
-    print_section("Example 4: Empty Posts - No Sentiment Data")
+    lines = format_section("Example 4: Empty Posts - No Sentiment Data")
 
-    generator = SignalGenerator()
+    generator = _get_generator()
 
     ticker = "TSLA"
     reddit_posts = []  # No posts
 
-    print(f"\nInput:")
-    print(f"  Ticker: {ticker}")
-    print(f"  Reddit Posts: {len(reddit_posts)} (empty)")
+    lines.append(f"\nInput:")
+    lines.append(f"  Ticker: {ticker}")
+    lines.append(f"  Reddit Posts: {len(reddit_posts)} (empty)")
 
-    print(f"\nGenerating signal...")
+    lines.append(f"\nGenerating signal...")
+    write_lines(lines)
     result = generator.generate_signal(ticker, reddit_posts)
-    print_signal_result(result)
+    lines.extend(format_signal_result(result))
+
+    lines.append(f"\nInterpretation:")
+    lines.append(f"  When no posts are provided:")
+    lines.append(f"  - Sentiment defaults to neutral (0.5)")
+    lines.append(f"  - Signal is based primarily on technical indicators")
 
-    print(f"\nInterpretation:")
-    print(f"  When no posts are provided:")
-    print(f"  - Sentiment defaults to neutral (0.5)")
-    print(f"  - Signal is based primarily on technical indicators")
+    write_lines(lines)
 
     return result
 
 
 def demo_custom_thresholds():
     """Demonstrate using custom thresholds."""
-    print_section("Example 5: Custom Thresholds - More Conservative Settings")
+    lines = format_section("Example 5: Custom Thresholds - More Conservative Settings")
 
     # More conservative settings
-    generator = SignalGenerator(
+    generator = _get_generator(
         sentiment_threshold=0.8,   # Higher sentiment required
         rsi_buy_threshold=25,      # Lower RSI required (more oversold)
         rsi_period=14
@@ -196,49 +261,54 @@ def demo_custom_thresholds():
         "Good company, good stock"
     ]
 
-    print(f"\nCustom Configuration:")
-    print(f"  Sentiment Threshold: 0.8 (vs default 0.7)")
-    print(f"  RSI Buy Threshold: 25 (vs default 30)")
-    print(f"  This makes the signal MORE CONSERVATIVE (fewer BUY signals)")
+    lines.append(f"\nCustom Configuration:")
+    lines.append(f"  Sentiment Threshold: 0.8 (vs default 0.7)")
+    lines.append(f"  RSI Buy Threshold: 25 (vs default 30)")
+    lines.append(f"  This makes the signal MORE CONSERVATIVE (fewer BUY signals)")
 
-    print(f"\nInput:")
-    print(f"  Ticker: {ticker}")
-    print(f"  Reddit Posts: {len(reddit_posts)} moderately positive comments")
+    lines.append(f"\nInput:")
+    lines.append(f"  Ticker: {ticker}")
+    lines.append(f"  Reddit Posts: {len(reddit_posts)} moderately positive comments")
 
-    print(f"\nGenerating signal...")
+    lines.append(f"\nGenerating signal...")
+    write_lines(lines)
     result = generator.generate_signal(ticker, reddit_posts)
-    print_signal_result(result)
+    lines.extend(format_signal_result(result))
+
+    write_lines(lines)
 
     return result
 
 
 def demo_json_export():
     """Demonstrate exporting signal as JSON."""
-    print_section("Example 6: JSON Export - Ready for API Integration")
+    lines = format_section("Example 6: JSON Export - Ready for API Integration")
 
-    generator = SignalGenerator()
+    generator = _get_generator()
     result = generator.generate_signal(
         "AAPL",
         ["Great stock!", "Love Apple products"]
     )
 
-    print(f"\nComplete JSON Response:")
-    print(json.dumps(result, indent=2))
+    lines.append(f"\nComplete JSON Response:")
+    lines.append(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode())
+
+    lines.append(f"\n\nThis JSON format is:")
+    lines.append(f"  - Ready for n8n HTTP Request nodes")
+    lines.append(f"  - Compatible with any REST API client")
+    lines.append(f"  - Includes all metadata for auditing")
+    lines.append(f"  - Follows standardized schema for consistency")
 
-    print(f"\n\nThis JSON format is:")
-    print(f"  - Ready for n8n HTTP Request nodes")
-    print(f"  - Compatible with any REST API client")
-    print(f"  - Includes all metadata for auditing")
-    print(f"  - Follows standardized schema for consistency")
+    write_lines(lines)
 
     return result
 
 
 def demo_programmatic_usage():
     """Demonstrate programmatic usage patterns."""
-    print_section("Example 7: Programmatic Usage Patterns")
+    lines = format_section("Example 7: Programmatic Usage Patterns")
 
-    generator = SignalGenerator()
+    generator = _get_generator()
 
     # Simulate processing multiple tickers
     watchlist = [
@@ -247,48 +317,64 @@ def demo_programmatic_usage():
         ("MSFT", ["Solid company", "Good long-term hold"])
     ]
 
-    buy_signals = []
-    hold_signals = []
-    neutral_signals = []
-
-    print(f"\nProcessing watchlist of {len(watchlist)} tickers...")
-
-    for ticker, posts in watchlist:
-        result = generator.generate_signal(ticker, posts)
+    lines.append(f"\nProcessing watchlist of {len(watchlist)} tickers...")
+    write_lines(lines)
+
+    # Prefetch price history for the whole watchlist in one batched download
+    prices = yf.download(
+        [ticker for ticker, _ in watchlist],
+        period="60d",
+        interval="1d",
+        group_by="ticker",
+        threads=True,
+        progress=False
+    )
 
-        if result['status'] == 'success':
-            if result['signal'] == 'BUY':
-                buy_signals.append(result)
-            elif result['signal'] == 'HOLD':
-                hold_signals.append(result)
-            else:
-                neutral_signals.append(result)
+    # Fan out the remaining per-ticker work on threads
+    with ThreadPoolExecutor(max_workers=min(16, len(watchlist))) as executor:
+        results = list(executor.map(
+            lambda item: generator.generate_signal(*item, price_history=prices[item[0]]),
+            watchlist
+        ))
+
+    # Count signals with a single C-level bincount sweep; failed results are skipped
+    counts = np.bincount(
+        np.fromiter(
+            (_SIGNAL_CODES[result['signal']] for result in results if result['status'] == 'success'),
+            dtype=np.int8
+        ),
+        minlength=len(_SIGNAL_CODES)
+    )
+    buy_signals = [
+        result for result in results
+        if result['status'] == 'success' and result['signal'] == 'BUY'
+    ]
 
-    print(f"\n\nResults Summary:")
-    print(f"  BUY signals: {len(buy_signals)}")
-    print(f"  HOLD signals: {len(hold_signals)}")
-    print(f"  NEUTRAL signals: {len(neutral_signals)}")
+    lines.append(f"\n\nResults Summary:")
+    for signal_type, count in zip(_SIGNAL_CODES, counts):
+        lines.append(f"  {signal_type} signals: {count}")
 
     if buy_signals:
-        print(f"\n\nBUY Opportunities:")
+        lines.append(f"\n\nBUY Opportunities:")
         for signal in buy_signals:
-            print(f"  - {signal['ticker']}: RSI={signal['rsi']}, Sentiment={signal['sentiment_score']}")
+            lines.append(f"  - {signal['ticker']}: RSI={signal['rsi']}, Sentiment={signal['sentiment_score']}")
+
+    write_lines(lines)
 
     return {
-        'buy': buy_signals,
-        'hold': hold_signals,
-        'neutral': neutral_signals
+        'counts': dict(zip(_SIGNAL_CODES, counts.tolist())),
+        'buy': buy_signals
     }
 
 
 def main():
     """Run all demonstrations."""
     print("\n")
-    print("*" * 70)
-    print("*" + " " * 68 + "*")
-    print("*" + "  TRADING SIGNAL SERVICE - COMPREHENSIVE DEMONSTRATION".center(68) + "*")
-    print("*" + " " * 68 + "*")
-    print("*" * 70)
+    print(_STAR)
+    print(_BLANK)
+    print(_HDR)
+    print(_BLANK)
+    print(_STAR)
 
     try:
         # Run demonstrations
@@ -343,9 +429,9 @@ For API usage, see:
   - examples/ directory (integration examples)
         """)
 
-        print("\n" + "*" * 70)
-        print("*" + "  ALL DEMONSTRATIONS COMPLETED SUCCESSFULLY".center(68) + "*")
-        print("*" * 70 + "\n")
+        print("\n" + _STAR)
+        print(_FOOTER)
+        print(_STAR + "\n")
 
     except Exception as e:
         print(f"\n\nERROR during demonstration: {e}")
@@ -11,10 +11,46 @@ Two integration methods are shown:
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import gzip
+import orjson
+import os
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Optional
 
 
+# Banner strings are constant, so build them once at import time
+_BAR = "=" * 70
+_STAR = "*" * 70
+_HDR = "*" + " TRADING SIGNAL SERVICE - PYTHON CLIENT EXAMPLES".center(68) + "*"
+_FOOTER = "*" + " EXAMPLES COMPLETED".center(68) + "*"
+
+
+def _get_generator(
+    sentiment_threshold: float = 0.7,
+    rsi_buy_threshold: float = 30,
+    rsi_period: int = 14
+):
+    """Return a shared SignalGenerator for the given configuration."""
+    # Normalize to positional args so keyword and default calls share a cache entry
+    return _cached_generator(sentiment_threshold, rsi_buy_threshold, rsi_period)
+
+
+@lru_cache(maxsize=8)
+def _cached_generator(
+    sentiment_threshold: float,
+    rsi_buy_threshold: float,
+    rsi_period: int
+):
+    from src.signal_generator import SignalGenerator
+
+    return SignalGenerator(sentiment_threshold, rsi_buy_threshold, rsi_period)
+
+
 class TradingSignalClient:
     """
     HTTP client for the Trading Signal Service API.
@@ -31,6 +67,13 @@ class TradingSignalClient:
         """
         self.base_url = base_url.rstrip('/')
 
+        # Reuse pooled keep-alive connections across calls
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def health_check(self) -> Dict:
         """
         Check if the service is healthy.
@@ -38,7 +81,7 @@ class TradingSignalClient:
         Returns:
             Health status response
         """
-        response = requests.get(f"{self.base_url}/health")
+        response = self.session.get(f"{self.base_url}/health")
         response.raise_for_status()
         return response.json()
 
@@ -49,7 +92,7 @@ class TradingSignalClient:
         Returns:
             Configuration parameters
         """
-        response = requests.get(f"{self.base_url}/api/config")
+        response = self.session.get(f"{self.base_url}/api/config")
         response.raise_for_status()
         return response.json()
 
@@ -70,59 +113,92 @@ class TradingSignalClient:
 
         Raises:
             requests.HTTPError: If the API request fails
+            RuntimeError: If the server responds with a non-JSON body
         """
         payload = {
             "ticker": ticker,
             "reddit_posts": reddit_posts
         }
 
-        response = requests.post(
+        # Pre-encode with orjson; the session already sends a JSON content type
+        response = self.session.post(
             f"{self.base_url}/api/signal",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            data=orjson.dumps(payload)
         )
 
         # Don't raise for 500 errors (still return the error response)
-        if response.status_code >= 400 and response.status_code < 500:
+        if not response.ok and 400 <= response.status_code < 500:
             response.raise_for_status()
 
+        # Proxies and crashed workers can answer with HTML; don't try to decode it
+        if 'application/json' not in response.headers.get('content-type', ''):
+            raise RuntimeError(f"Non-JSON {response.status_code}: {response.text[:200]}")
+
+        return response.json()
+
+    def generate_signals_batch(self, items: List[Dict]) -> List[Dict]:
+        """
+        Generate trading signals for several tickers in one request.
+
+        Args:
+            items: List of {"ticker": ..., "reddit_posts": [...]} dictionaries
+
+        Returns:
+            List of signal responses, in the same order as items
+
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/signal/batch",
+            data=orjson.dumps({"items": items})
+        )
+        response.raise_for_status()
         return response.json()
 
 
 # Example 1: Using the HTTP API Client
 def example_api_client():
     """Demonstrate using the HTTP API client."""
-    print("=" * 70)
+    print(_BAR)
     print("Example 1: Using HTTP API Client")
-    print("=" * 70)
+    print(_BAR)
 
     # Initialize client
     client = TradingSignalClient("http://localhost:5000")
 
     try:
-        # Check service health
-        print("\n1. Checking service health...")
-        health = client.health_check()
-        print(f"   Status: {health['status']}")
-        print(f"   Service: {health['service']}")
-        print(f"   Version: {health['version']}")
-
-        # Get configuration
-        print("\n2. Getting service configuration...")
-        config = client.get_config()
-        print(f"   Sentiment Threshold: {config['sentiment_threshold']}")
-        print(f"   RSI Buy Threshold: {config['rsi_buy_threshold']}")
-
-        # Generate signal
-        print("\n3. Generating signal for AAPL...")
-        signal = client.generate_signal(
-            ticker="AAPL",
-            reddit_posts=[
-                "Apple is crushing it this quarter!",
-                "AAPL is the best tech stock right now",
-                "Great earnings, buying more shares"
-            ]
-        )
+        # The three calls are independent, so issue them concurrently over the
+        # client's pooled session and print the results in order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            health_future = executor.submit(client.health_check)
+            config_future = executor.submit(client.get_config)
+            signal_future = executor.submit(
+                client.generate_signal,
+                ticker="AAPL",
+                reddit_posts=[
+                    "Apple is crushing it this quarter!",
+                    "AAPL is the best tech stock right now",
+                    "Great earnings, buying more shares"
+                ]
+            )
+
+            # Check service health
+            print("\n1. Checking service health...")
+            health = health_future.result()
+            print(f"   Status: {health['status']}")
+            print(f"   Service: {health['service']}")
+            print(f"   Version: {health['version']}")
+
+            # Get configuration
+            print("\n2. Getting service configuration...")
+            config = config_future.result()
+            print(f"   Sentiment Threshold: {config['sentiment_threshold']}")
+            print(f"   RSI Buy Threshold: {config['rsi_buy_threshold']}")
+
+            # Generate signal
+            print("\n3. Generating signal for AAPL...")
+            signal = signal_future.result()
 
         print(f"\n   Signal: {signal['signal']}")
         print(f"   Sentiment: {signal['sentiment_score']}")
@@ -140,16 +216,13 @@ def example_api_client():
 # Example 2: Using Direct Module Import (No API Required)
 def example_direct_import():
     """Demonstrate using the service modules directly."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("Example 2: Using Direct Module Import (No API Required)")
-    print("=" * 70)
+    print(_BAR)
 
     try:
-        # Import the signal generator
-        from src.signal_generator import SignalGenerator
-
         print("\n1. Initializing SignalGenerator...")
-        generator = SignalGenerator(
+        generator = _get_generator(
             sentiment_threshold=0.7,
             rsi_buy_threshold=30,
             rsi_period=14
@@ -180,13 +253,11 @@ def example_direct_import():
 # Example 3: Batch Processing Multiple Tickers
 def example_batch_processing():
     """Demonstrate batch processing of multiple tickers."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("Example 3: Batch Processing Multiple Tickers")
-    print("=" * 70)
+    print(_BAR)
 
     try:
-        from src.signal_generator import SignalGenerator
-
         # Define watchlist
         watchlist = {
             "AAPL": [
@@ -209,19 +280,38 @@ def example_batch_processing():
 
         print(f"\n Processing {len(watchlist)} tickers...")
 
-        generator = SignalGenerator()
-        results = []
+        generator = _get_generator()
+
+        # Prefetch price history for the whole watchlist in one batched download
+        import yfinance as yf
+
+        prices = yf.download(
+            list(watchlist),
+            period="60d",
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False
+        )
 
-        for ticker, posts in watchlist.items():
-            print(f"\n   Analyzing {ticker}...", end=" ")
-            signal = generator.generate_signal(ticker, posts)
-            results.append(signal)
-            print(f"{signal['signal']}")
+        # Fan out the remaining per-ticker work on threads
+        with ThreadPoolExecutor(max_workers=min(16, len(watchlist))) as executor:
+            results = list(executor.map(
+                lambda item: generator.generate_signal(*item, price_history=prices[item[0]]),
+                watchlist.items()
+            ))
 
-        # Summarize results
-        buy_signals = [r for r in results if r['signal'] == 'BUY']
-        hold_signals = [r for r in results if r['signal'] == 'HOLD']
-        neutral_signals = [r for r in results if r['signal'] == 'NEUTRAL']
+        for signal in results:
+            print(f"\n   {signal['ticker']}: {signal['signal']}")
+
+        # Summarize results, bucketing by signal in a single pass
+        buckets = defaultdict(list)
+        for r in results:
+            buckets[r['signal'] if r['status'] == 'success' else r['status']].append(r)
+
+        buy_signals = buckets['BUY']
+        hold_signals = buckets['HOLD']
+        neutral_signals = buckets['NEUTRAL']
 
         print(f"\n Summary:")
         print(f"   BUY signals: {len(buy_signals)}")
@@ -242,42 +332,31 @@ def example_batch_processing():
 # Example 4: Custom Signal Logic
 def example_custom_logic():
     """Demonstrate using custom thresholds and logic."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("Example 4: Custom Signal Logic (Conservative Strategy)")
-    print("=" * 70)
+    print(_BAR)
 
     try:
-        from src.signal_generator import SignalGenerator
-
-        # Create two generators with different strategies
-        aggressive = SignalGenerator(
-            sentiment_threshold=0.6,   # Lower threshold
-            rsi_buy_threshold=35       # Higher threshold
-        )
-
-        conservative = SignalGenerator(
-            sentiment_threshold=0.8,   # Higher threshold
-            rsi_buy_threshold=25       # Lower threshold
-        )
+        # Analyze once, then apply two strategies to the same data
+        generator = _get_generator()
 
         ticker = "AAPL"
         posts = ["Apple is doing well", "Good company"]
 
         print(f"\n Comparing strategies for {ticker}:")
+        analysis = generator.analyze(ticker, posts)
 
         print(f"\n   Aggressive Strategy (easier to trigger BUY):")
         print(f"     Sentiment > 0.6, RSI < 35")
-        agg_result = aggressive.generate_signal(ticker, posts)
-        print(f"     Result: {agg_result['signal']}")
+        print(f"     Result: {generator.decide(analysis, sentiment_threshold=0.6, rsi_buy_threshold=35)}")
 
         print(f"\n   Conservative Strategy (harder to trigger BUY):")
         print(f"     Sentiment > 0.8, RSI < 25")
-        con_result = conservative.generate_signal(ticker, posts)
-        print(f"     Result: {con_result['signal']}")
+        print(f"     Result: {generator.decide(analysis, sentiment_threshold=0.8, rsi_buy_threshold=25)}")
 
         print(f"\n   Analysis:")
-        print(f"     Sentiment Score: {agg_result['sentiment_score']}")
-        print(f"     RSI: {agg_result['rsi']}")
+        print(f"     Sentiment Score: {analysis['sentiment_score']}")
+        print(f"     RSI: {analysis['technical'].get('rsi')}")
         print(f"     Same data, different signals based on strategy!")
 
     except Exception as e:
@@ -287,14 +366,12 @@ def example_custom_logic():
 # Example 5: Error Handling
 def example_error_handling():
     """Demonstrate proper error handling."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("Example 5: Error Handling")
-    print("=" * 70)
+    print(_BAR)
 
     try:
-        from src.signal_generator import SignalGenerator
-
-        generator = SignalGenerator()
+        generator = _get_generator()
 
         # Test 1: Invalid ticker
         print("\n 1. Testing invalid ticker symbol...")
@@ -330,13 +407,11 @@ def example_error_handling():
 # Example 6: Integration with Data Pipeline
 def example_data_pipeline():
     """Demonstrate integration into a data pipeline."""
-    print("\n" + "=" * 70)
+    print("\n" + _BAR)
     print("Example 6: Integration into Data Pipeline")
-    print("=" * 70)
+    print(_BAR)
 
     try:
-        from src.signal_generator import SignalGenerator
-
         # Simulate data pipeline
         print("\n Simulating a data pipeline workflow:")
 
@@ -351,7 +426,7 @@ def example_data_pipeline():
 
         # Step 2: Generate signals
         print("\n   [2] Generating trading signals...")
-        generator = SignalGenerator()
+        generator = _get_generator()
         signals = {}
 
         for ticker, posts in reddit_data.items():
@@ -368,9 +443,24 @@ def example_data_pipeline():
 
         # Step 4: Export results
         print("\n   [4] Exporting results...")
-        output_file = "/tmp/trading_signals.json"
-        with open(output_file, 'w') as f:
-            json.dump(signals, f, indent=2)
+        output_file = Path(tempfile.gettempdir()) / "trading_signals.json.gz"
+        payload = orjson.dumps(signals, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+        # Write compressed to a temp file in the same directory, then atomically
+        # rename so readers never see a partially written export
+        tmp = tempfile.NamedTemporaryFile('wb', dir=output_file.parent, delete=False)
+        try:
+            with tmp:
+                tmp.write(gzip.compress(payload, compresslevel=6))
+            # Temp files are created 0600; give the export the usual permissions
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+            os.replace(tmp.name, output_file)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
         print(f"       Saved to: {output_file}")
 
         # Step 5: Generate alert (simulated)
@@ -393,9 +483,9 @@ def example_data_pipeline():
 def main():
     """Run all examples."""
     print("\n")
-    print("*" * 70)
-    print("*" + " TRADING SIGNAL SERVICE - PYTHON CLIENT EXAMPLES".center(68) + "*")
-    print("*" * 70)
+    print(_STAR)
+    print(_HDR)
+    print(_STAR)
 
     # Run examples that don't require API server
     example_direct_import()
@@ -407,9 +497,9 @@ def main():
     # Try API client example (may fail if server not running)
     example_api_client()
 
-    print("\n" + "*" * 70)
-    print("*" + " EXAMPLES COMPLETED".center(68) + "*")
-    print("*" * 70)
+    print("\n" + _STAR)
+    print(_FOOTER)
+    print(_STAR)
     print("\nNext Steps:")
     print("  - Adapt these examples for your use case")
     print("  - Integrate into your existing workflows")
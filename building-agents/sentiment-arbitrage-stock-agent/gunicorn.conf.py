@@ -0,0 +1,41 @@
+"""
+Gunicorn configuration for the Trading Signal Service.
+
+Signal requests spend nearly all their time waiting on Yahoo Finance, so
+each worker runs gevent greenlets rather than a handful of threads.
+Gunicorn loads this file automatically when started from the project root:
+
+    gunicorn src.api:app
+"""
+
+import os
+
+# The app is preloaded in the master (see preload_app below), so patch the
+# standard library before it imports requests and ssl
+from gevent import monkey
+
+monkey.patch_all()
+
+from dotenv import load_dotenv  # noqa: E402
+
+# Gunicorn reads these settings before the app is imported, so load .env
+# here as well or the values below would ignore it
+load_dotenv()
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5000')}"
+
+worker_class = "gevent"
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+# The app sizes its sentiment scoring pool from this, so expose the default too
+os.environ.setdefault("GUNICORN_WORKERS", str(workers))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+# Import the app (TextBlob lexicon, compiled RSI kernels) once in the master;
+# forked workers share those pages copy-on-write and skip the cold start
+preload_app = True
+
+# Allow for slow yfinance responses
+timeout = 120
+
+loglevel = os.getenv("LOG_LEVEL", "INFO").lower()
+accesslog = "-"
@@ -20,7 +20,19 @@ if __name__ == "__main__":
     print(f"Debug mode: {debug}")
     print("\nAvailable endpoints:")
     print(f"  - POST http://{host}:{port}/api/signal")
+    print(f"  - POST http://{host}:{port}/api/signal/batch")
     print(f"  - GET  http://{host}:{port}/health")
     print(f"  - GET  http://{host}:{port}/api/config")
+    print(f"  - POST http://{host}:{port}/api/validate-batch")
 
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        app.run(host=host, port=port, debug=debug)
+    else:
+        # Signal requests spend most of their time waiting on yfinance, so serve
+        # them from a thread pool instead of the single-threaded dev server.
+        # Production alternative: gunicorn src.api:app (see gunicorn.conf.py)
+        from waitress import serve
+
+        threads = int(os.getenv("FLASK_THREADS", "16"))
+        print(f"Serving with waitress ({threads} threads)")
+        serve(app, host=host, port=port, threads=threads)
@@ -5,14 +5,19 @@ Exposes trading signal generation via RESTful endpoints.
 Designed for integration with n8n and other automation tools.
 """
 
-from flask import Flask, request, jsonify
-from typing import Dict
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 import logging
 import os
+import orjson
+import requests
 from dotenv import load_dotenv
-import yfinance as yf
 
+from src.cache import RequestCoalescer, TTLCache, digest_key
 from src.signal_generator import SignalGenerator
+from src.yahoo_chart import TickerNotFoundError, fetch_chart, yahoo_session
 
 # Load environment variables
 load_dotenv()
@@ -24,8 +29,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that parses and serializes with orjson."""
+
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response without the intermediate str round-trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Initialize signal generator with configuration from environment
 signal_generator = SignalGenerator(
@@ -34,6 +61,44 @@ signal_generator = SignalGenerator(
     rsi_period=int(os.getenv("RSI_PERIOD", "14"))
 )
 
+# Upper bound on items accepted by /api/signal/batch
+MAX_BATCH_ITEMS = int(os.getenv("MAX_BATCH_ITEMS", "50"))
+
+# Ticker listings rarely change; remember valid tickers for a day. An
+# invalid result may come from a transient Yahoo failure, so it only
+# sticks for a few minutes.
+_validation_cache = TTLCache(ttl_seconds=24 * 60 * 60, maxsize=4096)
+INVALID_TICKER_TTL_SECONDS = 10 * 60
+
+# Concurrent identical requests share one upstream computation
+_inflight = RequestCoalescer()
+
+# Upper bound on tickers accepted by /api/validate-batch
+MAX_VALIDATE_TICKERS = int(os.getenv("MAX_VALIDATE_TICKERS", "500"))
+
+# Yahoo's spark endpoint answers for up to 20 symbols per request
+YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+SPARK_CHUNK_SIZE = 20
+
+
+def _has_malformed_json() -> bool:
+    """Return True if the request carries a body that does not parse as JSON."""
+    return request.get_json(silent=True) is None and bool(request.get_data())
+
+
+def _malformed_json_response() -> tuple[Response, int]:
+    """Build the 400 response for a request body that is not valid JSON."""
+    logger.warning("Invalid request: body is not valid JSON")
+    return jsonify({
+        "status": "error",
+        "error": "Request body must be valid JSON"
+    }), 400
+
+
+def _is_terse() -> bool:
+    """Return True if the request asked for terse results via ?terse=1."""
+    return request.args.get("terse", "").lower() in ("1", "true", "yes")
+
 
 def validate_request_payload(data: Dict) -> tuple[bool, str]:
     """
@@ -92,12 +157,17 @@ def generate_signal():
             "reddit_posts": ["Great stock!", "To the moon!", ...]
         }
 
+    Query Parameters:
+        terse: Set to 1 to omit the human-readable reason from the response
+
     Returns:
         JSON response with trading signal and analysis details
     """
     try:
         # Parse request
-        data = request.get_json()
+        if _has_malformed_json():
+            return _malformed_json_response()
+        data = request.get_json(silent=True)
 
         # Validate payload
         is_valid, error_message = validate_request_payload(data)
@@ -110,11 +180,18 @@ def generate_signal():
 
         ticker = data["ticker"].strip().upper()
         reddit_posts = data["reddit_posts"]
+        include_reason = not _is_terse()
 
         logger.info(f"Processing signal request for {ticker} with {len(reddit_posts)} posts")
 
         # Generate signal
-        signal_result = signal_generator.generate_signal(ticker, reddit_posts)
+        signal_result = _inflight.run(
+            ("signal", ticker, digest_key(reddit_posts), include_reason),
+            signal_generator.generate_signal,
+            ticker,
+            reddit_posts,
+            include_reason=include_reason
+        )
 
         # Return appropriate status code based on result
         if signal_result["status"] == "error":
@@ -135,6 +212,87 @@ def generate_signal():
         }), 500
 
 
+@app.route("/api/signal/batch", methods=["POST"])
+def generate_signal_batch():
+    """
+    Generate trading signals for several tickers in one request.
+
+    Items are processed concurrently, so the yfinance fetches overlap.
+
+    Request Body:
+        {
+            "items": [
+                {"ticker": "AAPL", "reddit_posts": ["Great stock!", ...]},
+                {"ticker": "TSLA", "reddit_posts": ["Overvalued", ...]}
+            ]
+        }
+
+    Query Parameters:
+        terse: Set to 1 to omit the human-readable reason from each result
+
+    Returns:
+        JSON array of signal results, in the same order as the items
+    """
+    try:
+        if _has_malformed_json():
+            return _malformed_json_response()
+        data = request.get_json(silent=True)
+
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("items"), list)
+            or not data["items"]
+        ):
+            logger.warning("Invalid batch request: items must be a non-empty list")
+            return jsonify({
+                "status": "error",
+                "error": "items must be a non-empty list"
+            }), 400
+
+        items = data["items"]
+        if len(items) > MAX_BATCH_ITEMS:
+            logger.warning(f"Invalid batch request: {len(items)} items exceeds limit")
+            return jsonify({
+                "status": "error",
+                "error": f"items cannot contain more than {MAX_BATCH_ITEMS} entries"
+            }), 400
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                is_valid, error_message = False, "item must be an object"
+            else:
+                is_valid, error_message = validate_request_payload(item)
+            if not is_valid:
+                logger.warning(f"Invalid batch request: items[{index}]: {error_message}")
+                return jsonify({
+                    "status": "error",
+                    "error": f"items[{index}]: {error_message}"
+                }), 400
+
+        include_reason = not _is_terse()
+        logger.info(f"Processing batch signal request with {len(items)} items")
+
+        with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+            results = list(executor.map(
+                lambda item: signal_generator.generate_signal(
+                    item["ticker"].strip().upper(),
+                    item["reddit_posts"],
+                    include_reason=include_reason
+                ),
+                items
+            ))
+
+        return jsonify(results), 200
+
+    except Exception as e:
+        logger.error(f"Unexpected error processing batch request: {e}", exc_info=True)
+        return jsonify({
+            "status": "error",
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
 @app.route("/api/config", methods=["GET"])
 def get_configuration():
     """
@@ -154,7 +312,7 @@ def get_configuration():
 @app.route("/api/validate/<ticker>", methods=["GET"])
 def validate_ticker(ticker):
     """
-    Validate if a ticker symbol exists in yfinance.
+    Validate if a ticker symbol exists on Yahoo Finance.
 
     Use this as a filter node in n8n before calling /api/signal.
 
@@ -169,11 +327,7 @@ def validate_ticker(ticker):
     logger.info(f"Validating ticker: {ticker}")
 
     try:
-        stock = yf.Ticker(ticker)
-        # Use history with short period - more reliable than fast_info
-        hist = stock.history(period="5d")
-
-        if not hist.empty and len(hist) > 0:
+        if check_ticker(ticker):
             return jsonify({
                 "valid": True,
                 "ticker": ticker,
@@ -193,6 +347,163 @@ def validate_ticker(ticker):
         }), 404
 
 
+def check_ticker(ticker: str) -> bool:
+    """
+    Check a single ticker against Yahoo's chart endpoint, using the
+    validation cache.
+
+    Args:
+        ticker: Upper-case stock ticker symbol
+
+    Returns:
+        True if Yahoo returns recent price history for the ticker, False if
+        Yahoo reports the symbol as not found
+
+    Raises:
+        requests.RequestException: If the request fails, e.g. 429 or 5xx
+            (nothing is cached)
+        ValueError: If Yahoo returns an unreadable chart (nothing is cached)
+    """
+    is_valid = _validation_cache.get(ticker)
+    if is_valid is not None:
+        return is_valid
+
+    try:
+        _inflight.run(("validate", ticker), fetch_chart, ticker, "5d", "1d")
+        is_valid = True
+    except TickerNotFoundError:
+        is_valid = False
+    _cache_validation(ticker, is_valid)
+    return is_valid
+
+
+def _cache_validation(ticker: str, is_valid: bool) -> None:
+    """Remember a validation outcome; negatives expire quickly."""
+    _validation_cache.set(
+        ticker, is_valid, None if is_valid else INVALID_TICKER_TTL_SECONDS
+    )
+
+
+def _validate_chunk(chunk: List[str]) -> Dict[str, bool]:
+    """
+    Validate up to SPARK_CHUNK_SIZE tickers with one spark request.
+
+    Falls back to checking each ticker individually if the spark request
+    fails or returns something unexpected (no requested symbol appears as
+    a key, e.g. an error body or a different envelope).
+
+    Args:
+        chunk: Upper-case ticker symbols
+
+    Returns:
+        Mapping of ticker to validity
+    """
+    try:
+        response = yahoo_session.get(
+            YAHOO_SPARK_URL,
+            params={"symbols": ",".join(chunk), "range": "1d", "interval": "5m"},
+            timeout=10
+        )
+        response.raise_for_status()
+        spark = response.json()
+        if not isinstance(spark, dict) or not any(ticker in spark for ticker in chunk):
+            raise ValueError("unexpected spark response shape")
+        results = {
+            ticker: bool((spark.get(ticker) or {}).get("close"))
+            for ticker in chunk
+        }
+    except (requests.RequestException, ValueError, AttributeError) as e:
+        logger.warning(f"Spark validation failed for {len(chunk)} tickers, checking individually: {e}")
+        results = {}
+        for ticker in chunk:
+            try:
+                results[ticker] = check_ticker(ticker)
+            except Exception as ticker_error:
+                logger.warning(f"Ticker validation failed for {ticker}: {ticker_error}")
+                results[ticker] = False
+        return results
+
+    for ticker, is_valid in results.items():
+        _cache_validation(ticker, is_valid)
+    return results
+
+
+@app.route("/api/validate-batch", methods=["POST"])
+def validate_ticker_batch():
+    """
+    Validate many ticker symbols in one call.
+
+    Tickers are checked against Yahoo's spark endpoint in chunks of
+    SPARK_CHUNK_SIZE, with chunks fetched concurrently.
+
+    Expected JSON payload:
+    {
+        "tickers": ["AAPL", "TSLA", "XYZ"]
+    }
+
+    Returns:
+        200 with {"results": [{"ticker": "AAPL", "valid": true}, ...]}
+        in request order, or 400 if the payload is invalid
+    """
+    if _has_malformed_json():
+        return _malformed_json_response()
+    data = request.get_json(silent=True)
+
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("tickers"), list)
+        or not data["tickers"]
+    ):
+        logger.warning("Invalid validate-batch request: tickers must be a non-empty list")
+        return jsonify({
+            "status": "error",
+            "error": "tickers must be a non-empty list"
+        }), 400
+
+    raw_tickers = data["tickers"]
+    if len(raw_tickers) > MAX_VALIDATE_TICKERS:
+        logger.warning(f"Invalid validate-batch request: {len(raw_tickers)} tickers exceeds limit")
+        return jsonify({
+            "status": "error",
+            "error": f"tickers cannot contain more than {MAX_VALIDATE_TICKERS} entries"
+        }), 400
+
+    if not all(isinstance(ticker, str) and ticker.strip() for ticker in raw_tickers):
+        logger.warning("Invalid validate-batch request: tickers must be non-empty strings")
+        return jsonify({
+            "status": "error",
+            "error": "tickers must be non-empty strings"
+        }), 400
+
+    tickers = [ticker.strip().upper() for ticker in raw_tickers]
+    logger.info(f"Validating batch of {len(tickers)} tickers")
+
+    validity = {}
+    pending = []
+    for ticker in dict.fromkeys(tickers):
+        is_valid = _validation_cache.get(ticker)
+        if is_valid is None:
+            pending.append(ticker)
+        else:
+            validity[ticker] = is_valid
+
+    if pending:
+        chunks = [
+            pending[i:i + SPARK_CHUNK_SIZE]
+            for i in range(0, len(pending), SPARK_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+            for chunk_results in executor.map(_validate_chunk, chunks):
+                validity.update(chunk_results)
+
+    return jsonify({
+        "results": [
+            {"ticker": ticker, "valid": validity[ticker]}
+            for ticker in tickers
+        ]
+    }), 200
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
@@ -0,0 +1,150 @@
+"""
+Cache Module
+
+Provides a small thread-safe in-memory TTL cache used to avoid repeating
+identical yfinance requests within a short window, and a coalescer that
+lets concurrent identical requests share a single upstream call.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+import hashlib
+import logging
+import threading
+import time
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def digest_key(value: Any) -> str:
+    """
+    Return a compact digest of a JSON-serializable value for use in cache keys.
+
+    Args:
+        value: Value to fingerprint (e.g. a list of posts)
+
+    Returns:
+        16-character hex digest
+    """
+    return hashlib.blake2b(orjson.dumps(value), digest_size=8).hexdigest()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries; least recently used are evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value under key, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Lifetime for this entry (defaults to the cache TTL)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RequestCoalescer:
+    """Shares one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self):
+        """Initialize the coalescer."""
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.deduped = 0
+
+    def run(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call fn, or wait for an identical call already in progress.
+
+        The first caller for a key runs fn; callers arriving before it
+        finishes block on the same Future and receive its result or exception.
+
+        Args:
+            key: Identifies equivalent calls
+            fn: Function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.deduped += 1
+
+        if not is_owner:
+            logger.info(f"cached_dedupe: joined in-flight call for {key!r} (total={self.deduped})")
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
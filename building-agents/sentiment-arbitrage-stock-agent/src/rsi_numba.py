@@ -0,0 +1,67 @@
+"""
+RSI Numba Module
+
+Numba-compiled Wilder-smoothed RSI kernels operating on plain NumPy arrays.
+"""
+
+from numba import njit, types
+import numpy as np
+
+# Every shipped configuration uses the standard 14-day RSI
+DEFAULT_RSI_PERIOD = 14
+
+
+@njit(cache=True, fastmath=True)
+def wilder_rsi(closes: np.ndarray, period: int) -> float:
+    """
+    Compute the most recent Wilder-smoothed RSI over an array of closes.
+
+    Runs in a single pass and returns only the final value, without
+    building the intermediate gain/loss series.
+
+    Args:
+        closes: Contiguous float64 array of closing prices (oldest first)
+        period: RSI period; closes must hold at least period + 1 values
+
+    Returns:
+        Current RSI value (0-100), or NaN if prices never moved
+    """
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        delta = closes[i] - closes[i - 1]
+        gain += max(delta, 0.0)
+        loss += max(-delta, 0.0)
+
+    avg_gain = gain / period
+    avg_loss = loss / period
+    for i in range(period + 1, closes.size):
+        delta = closes[i] - closes[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+
+    if avg_loss == 0.0:
+        return np.nan if avg_gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+# Closes stay float64 as yfinance delivers them: a float32 copy would cost
+# more than the 60-bar loop it speeds up, and single-precision Wilder
+# smoothing can shift RSI values that sit near the buy threshold.
+# pandas may hand back read-only views of its buffers, so compile for both
+_CLOSE_ARRAY_TYPES = (
+    types.Array(types.float64, 1, "C"),
+    types.Array(types.float64, 1, "C", readonly=True),
+)
+
+
+@njit([types.float64(array_type) for array_type in _CLOSE_ARRAY_TYPES], cache=True, fastmath=True)
+def wilder_rsi14(closes: np.ndarray) -> float:
+    """
+    Wilder RSI specialized for the default 14-day period.
+
+    Compiled eagerly (and cached on disk) so the first request does not pay
+    JIT latency; the period is a compile-time constant, letting LLVM unroll
+    the seeding loop and simplify the smoothing arithmetic.
+    """
+    return wilder_rsi(closes, DEFAULT_RSI_PERIOD)
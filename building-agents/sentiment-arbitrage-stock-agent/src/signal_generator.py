@@ -5,15 +5,68 @@ Combines sentiment analysis and technical indicators to generate trading signals
 Implements the core signal logic and decision-making process.
 """
 
-from typing import Dict, List
-from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import copy
 import logging
+import multiprocessing
+import os
+import time
+import pandas as pd
 
+from src.cache import TTLCache, digest_key
 from src.sentiment_analyzer import SentimentAnalyzer
 from src.technical_indicators import TechnicalIndicatorCalculator
 
 logger = logging.getLogger(__name__)
 
+# Repeat requests for the same ticker and posts within this window reuse the
+# previous signal; daily RSI and volume barely move in a minute
+SIGNAL_CACHE_TTL_SECONDS = 60
+
+# Threads that fetch price history while the request thread scores sentiment
+_fetch_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="price-fetch")
+
+# Signal explanations, formatted only when a caller asks for the reason
+BUY_REASON = (
+    "Strong bullish sentiment ({sentiment_score:.2f} > {sentiment_threshold}) "
+    "combined with oversold conditions (RSI {rsi:.2f} < {rsi_buy_threshold}). "
+    "Potential buying opportunity."
+)
+BULLISH_HOLD_REASON = (
+    "Bullish sentiment ({sentiment_score:.2f}) but RSI ({rsi:.2f}) "
+    "not oversold. Wait for better entry point."
+)
+OVERSOLD_HOLD_REASON = (
+    "RSI oversold ({rsi:.2f}) but sentiment weak ({sentiment_score:.2f}). "
+    "Technical setup present but lacking sentiment confirmation."
+)
+NEUTRAL_REASON = (
+    "Neutral conditions: sentiment={sentiment_score:.2f}, RSI={rsi:.2f}. "
+    "No clear trading opportunity."
+)
+
+
+@lru_cache(maxsize=4)
+def _utc_second_prefix(epoch_seconds: int) -> str:
+    """Format the date-and-time part of a UTC timestamp (shared within a second)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_seconds))
+
+
+def utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with microseconds.
+
+    Equivalent to datetime.utcnow().isoformat() + "Z", but only formats
+    the calendar fields once per second.
+
+    Returns:
+        Timestamp such as '2024-01-15T14:30:00.123456Z'
+    """
+    epoch_seconds, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    return f"{_utc_second_prefix(epoch_seconds)}.{micros:06d}Z"
+
 
 class SignalGenerator:
     """Generates trading signals based on sentiment and technical analysis."""
@@ -39,6 +92,9 @@ class SignalGenerator:
         self.sentiment_analyzer = SentimentAnalyzer()
         self.technical_calculator = TechnicalIndicatorCalculator(rsi_period)
 
+        # Recent successful signals keyed by (ticker, posts digest, include_reason)
+        self._signal_cache = TTLCache(ttl_seconds=SIGNAL_CACHE_TTL_SECONDS, maxsize=1024)
+
         logger.info(
             f"SignalGenerator initialized: "
             f"sentiment_threshold={sentiment_threshold}, "
@@ -48,8 +104,12 @@ class SignalGenerator:
     def determine_signal(
         self,
         sentiment_score: float,
-        rsi: float
-    ) -> tuple[str, str]:
+        rsi: float,
+        *,
+        sentiment_threshold: Optional[float] = None,
+        rsi_buy_threshold: Optional[float] = None,
+        include_reason: bool = True
+    ) -> tuple[str, Optional[str]]:
         """
         Determine trading signal based on sentiment and RSI.
 
@@ -61,46 +121,131 @@ class SignalGenerator:
         Args:
             sentiment_score: Normalized sentiment (0-1)
             rsi: Current RSI value (0-100)
+            sentiment_threshold: Override for the instance sentiment threshold
+            rsi_buy_threshold: Override for the instance RSI buy threshold
+            include_reason: Whether to format the explanation string
 
         Returns:
-            Tuple of (signal, reason)
+            Tuple of (signal, reason); reason is None if include_reason is False
         """
-        sentiment_bullish = sentiment_score > self.sentiment_threshold
-        rsi_oversold = rsi < self.rsi_buy_threshold
+        if sentiment_threshold is None:
+            sentiment_threshold = self.sentiment_threshold
+        if rsi_buy_threshold is None:
+            rsi_buy_threshold = self.rsi_buy_threshold
 
-        if sentiment_bullish and rsi_oversold:
-            reason = (
-                f"Strong bullish sentiment ({sentiment_score:.2f} > {self.sentiment_threshold}) "
-                f"combined with oversold conditions (RSI {rsi:.2f} < {self.rsi_buy_threshold}). "
-                f"Potential buying opportunity."
-            )
-            return "BUY", reason
+        sentiment_bullish = sentiment_score > sentiment_threshold
+        rsi_oversold = rsi < rsi_buy_threshold
 
+        if sentiment_bullish and rsi_oversold:
+            signal, template = "BUY", BUY_REASON
         elif sentiment_bullish:
-            reason = (
-                f"Bullish sentiment ({sentiment_score:.2f}) but RSI ({rsi:.2f}) "
-                f"not oversold. Wait for better entry point."
-            )
-            return "HOLD", reason
-
+            signal, template = "HOLD", BULLISH_HOLD_REASON
         elif rsi_oversold:
-            reason = (
-                f"RSI oversold ({rsi:.2f}) but sentiment weak ({sentiment_score:.2f}). "
-                f"Technical setup present but lacking sentiment confirmation."
+            signal, template = "HOLD", OVERSOLD_HOLD_REASON
+        else:
+            signal, template = "NEUTRAL", NEUTRAL_REASON
+
+        if not include_reason:
+            return signal, None
+
+        reason = template.format(
+            sentiment_score=sentiment_score,
+            rsi=rsi,
+            sentiment_threshold=sentiment_threshold,
+            rsi_buy_threshold=rsi_buy_threshold
+        )
+        return signal, reason
+
+    def analyze(
+        self,
+        ticker: str,
+        reddit_posts: List[str],
+        price_history: Optional[pd.DataFrame] = None
+    ) -> Dict:
+        """
+        Run sentiment and technical analysis for a ticker without applying thresholds.
+
+        The result can be passed to decide() repeatedly to evaluate several
+        strategies against a single price fetch. When price history has to be
+        fetched, the download runs on a worker thread while sentiment is
+        scored on the calling thread.
+
+        Args:
+            ticker: Stock symbol (e.g., 'AAPL')
+            reddit_posts: List of Reddit comment strings for sentiment analysis
+            price_history: Optional prefetched daily price history for the ticker
+
+        Returns:
+            Dictionary containing:
+                - ticker: Stock symbol
+                - sentiment_score: Aggregated sentiment (0-1)
+                - sentiment_details: Output of SentimentAnalyzer.aggregate_sentiment
+                - technical: Output of TechnicalIndicatorCalculator.analyze_ticker
+        """
+        # Step 1: Start fetching technical indicators (network-bound)
+        technical_future = None
+        if price_history is None:
+            logger.info(f"Fetching technical indicators for {ticker}")
+            technical_future = _fetch_executor.submit(
+                self.technical_calculator.analyze_ticker, ticker
             )
-            return "HOLD", reason
+            # Under gevent (gunicorn.conf.py) the executor's threads are
+            # greenlets and scoring never yields; yield once so the fetch
+            # sends its request before scoring starts. A no-op with threads.
+            time.sleep(0)
 
+        # Step 2: Analyze sentiment while the fetch is in flight
+        logger.info(f"Analyzing sentiment for {ticker} from {len(reddit_posts)} posts")
+        sentiment_result = self.sentiment_analyzer.aggregate_sentiment(reddit_posts)
+
+        if technical_future is not None:
+            technical_result = technical_future.result()
         else:
-            reason = (
-                f"Neutral conditions: sentiment={sentiment_score:.2f}, RSI={rsi:.2f}. "
-                f"No clear trading opportunity."
-            )
-            return "NEUTRAL", reason
+            technical_result = self.technical_calculator.analyze_ticker(ticker, price_history)
+
+        return {
+            "ticker": ticker.upper(),
+            "sentiment_score": sentiment_result["normalized_score"],
+            "sentiment_details": sentiment_result,
+            "technical": technical_result
+        }
+
+    def decide(
+        self,
+        analysis: Dict,
+        sentiment_threshold: Optional[float] = None,
+        rsi_buy_threshold: Optional[float] = None
+    ) -> str:
+        """
+        Apply signal thresholds to a previously computed analysis.
+
+        Args:
+            analysis: Result of analyze()
+            sentiment_threshold: Minimum sentiment for BUY (defaults to the instance value)
+            rsi_buy_threshold: Maximum RSI for BUY (defaults to the instance value)
+
+        Returns:
+            BUY, HOLD, NEUTRAL, or ERROR if technical data was unavailable
+        """
+        if analysis["technical"]["status"] == "error":
+            return "ERROR"
+
+        signal, _ = self.determine_signal(
+            analysis["sentiment_score"],
+            analysis["technical"]["rsi"],
+            sentiment_threshold=sentiment_threshold,
+            rsi_buy_threshold=rsi_buy_threshold,
+            include_reason=False
+        )
+        return signal
 
     def generate_signal(
         self,
         ticker: str,
-        reddit_posts: List[str]
+        reddit_posts: List[str],
+        price_history: Optional[pd.DataFrame] = None,
+        *,
+        include_reason: bool = True
     ) -> Dict:
         """
         Generate a complete trading signal for a ticker.
@@ -108,6 +253,10 @@ class SignalGenerator:
         Args:
             ticker: Stock symbol (e.g., 'AAPL')
             reddit_posts: List of Reddit comment strings for sentiment analysis
+            price_history: Optional prefetched daily price history for the ticker;
+                avoids a per-ticker yfinance request when batching
+            include_reason: Whether to include the signal explanation; when
+                False the reason key is omitted from successful results
 
         Returns:
             Standardized signal dictionary containing:
@@ -121,18 +270,31 @@ class SignalGenerator:
                 - status: success, partial, or error
                 - metadata: Additional context
                 - errors: List of errors if any
+
+            Successful signals computed from freshly fetched data are cached
+            for SIGNAL_CACHE_TTL_SECONDS; a cache hit is returned as an
+            independent copy with a new timestamp.
         """
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = utc_timestamp()
         errors = []
 
-        # Step 1: Analyze sentiment
-        logger.info(f"Analyzing sentiment for {ticker} from {len(reddit_posts)} posts")
-        sentiment_result = self.sentiment_analyzer.aggregate_sentiment(reddit_posts)
-        sentiment_score = sentiment_result["normalized_score"]
+        # Prefetched price history is caller-specific, so only cache fetched data
+        cache_key = None
+        if price_history is None:
+            cache_key = (ticker.upper(), digest_key(reddit_posts), include_reason)
+            cached = self._signal_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached {cached['signal']} signal for {ticker}")
+                # Deep copy so callers never share the cached nested dicts
+                result = copy.deepcopy(cached)
+                result["timestamp"] = timestamp
+                return result
 
-        # Step 2: Fetch technical indicators
-        logger.info(f"Fetching technical indicators for {ticker}")
-        technical_result = self.technical_calculator.analyze_ticker(ticker)
+        # Steps 1-2: Analyze sentiment and fetch technical indicators
+        analysis = self.analyze(ticker, reddit_posts, price_history)
+        sentiment_result = analysis["sentiment_details"]
+        sentiment_score = analysis["sentiment_score"]
+        technical_result = analysis["technical"]
 
         if technical_result["status"] == "error":
             # Cannot generate signal without technical data
@@ -165,11 +327,16 @@ class SignalGenerator:
         price = technical_result["price"]
 
         # Step 3: Generate signal
-        signal, reason = self.determine_signal(sentiment_score, rsi)
+        signal, reason = self.determine_signal(
+            sentiment_score, rsi, include_reason=include_reason
+        )
 
-        logger.info(f"Generated {signal} signal for {ticker}: {reason}")
+        if include_reason:
+            logger.info(f"Generated {signal} signal for {ticker}: {reason}")
+        else:
+            logger.info(f"Generated {signal} signal for {ticker}")
 
-        return {
+        result = {
             "signal": signal,
             "ticker": ticker.upper(),
             "sentiment_score": sentiment_score,
@@ -197,3 +364,73 @@ class SignalGenerator:
             },
             "errors": errors if errors else []
         }
+        if not include_reason:
+            del result["reason"]
+        if cache_key is not None:
+            self._signal_cache.set(cache_key, copy.deepcopy(result))
+        return result
+
+
+# Per-process generator used by batch_signals workers
+_worker_generator: Optional[SignalGenerator] = None
+
+
+def _worker_init(
+    sentiment_threshold: float,
+    rsi_buy_threshold: float,
+    rsi_period: int
+) -> None:
+    """Build one SignalGenerator per worker process."""
+    global _worker_generator
+    _worker_generator = SignalGenerator(sentiment_threshold, rsi_buy_threshold, rsi_period)
+
+
+def _worker_signal(item: Tuple[str, List[str], pd.DataFrame]) -> Dict:
+    """Generate a signal inside a worker process."""
+    ticker, reddit_posts, price_history = item
+    return _worker_generator.generate_signal(ticker, reddit_posts, price_history)
+
+
+def batch_signals(
+    items: List[Tuple[str, List[str]]],
+    prefetched_prices: Mapping[str, pd.DataFrame],
+    sentiment_threshold: float = 0.7,
+    rsi_buy_threshold: float = 30,
+    rsi_period: int = 14,
+    max_workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    Generate signals for many tickers across worker processes.
+
+    Use this when price history is already prefetched (e.g. from a batched
+    yf.download) so the remaining work is CPU-bound sentiment and RSI
+    scoring, which threads cannot parallelize under the GIL. Workers are
+    spawned, so scripts calling this need an if __name__ == "__main__" guard.
+
+    Args:
+        items: List of (ticker, reddit_posts) tuples
+        prefetched_prices: Mapping of ticker to its daily price history; a
+            yf.download(..., group_by='ticker') DataFrame works directly
+        sentiment_threshold: Minimum sentiment score for BUY signal (0-1)
+        rsi_buy_threshold: Maximum RSI for BUY signal (0-100)
+        rsi_period: Period for RSI calculation
+        max_workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        List of signal dictionaries, in the same order as items
+    """
+    if not items:
+        return []
+
+    # Ship each worker only its ticker's slice rather than the full frame
+    work = [(ticker, posts, prefetched_prices[ticker]) for ticker, posts in items]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(work))
+
+    # spawn rather than fork: the calling process may already run fetch threads
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_worker_init,
+        initargs=(sentiment_threshold, rsi_buy_threshold, rsi_period)
+    ) as executor:
+        return list(executor.map(_worker_signal, work))
@@ -7,16 +7,35 @@ Implements RSI, volume analysis, and other technical metrics.
 
 import yfinance as yf
 import pandas as pd
+import numpy as np
+from functools import lru_cache
 from typing import Dict, Optional
 import logging
+import requests
+
+from src.cache import RequestCoalescer, TTLCache
+from src.rsi_numba import DEFAULT_RSI_PERIOD, wilder_rsi, wilder_rsi14
+from src.yahoo_chart import TickerNotFoundError, fetch_chart, yahoo_session
 
 logger = logging.getLogger(__name__)
 
+# Daily bars barely move within a few minutes; share fetches across requests
+_history_cache = TTLCache(ttl_seconds=15 * 60, maxsize=512)
+
+# Concurrent cold requests for the same history share one download
+_history_fetches = RequestCoalescer()
+
+
+@lru_cache(maxsize=512)
+def get_ticker(ticker: str) -> yf.Ticker:
+    """Return a shared yfinance Ticker object for a symbol."""
+    return yf.Ticker(ticker, session=yahoo_session)
+
 
 class TechnicalIndicatorCalculator:
     """Calculates technical indicators for stock analysis."""
 
-    def __init__(self, rsi_period: int = 14):
+    def __init__(self, rsi_period: int = DEFAULT_RSI_PERIOD):
         """
         Initialize the technical indicator calculator.
 
@@ -25,15 +44,15 @@ class TechnicalIndicatorCalculator:
         """
         self.rsi_period = rsi_period
 
-    def calculate_rsi(self, prices: pd.Series, period: int = None) -> float:
+    def calculate_rsi(self, prices: np.ndarray, period: int = None) -> float:
         """
         Calculate the Relative Strength Index (RSI).
 
         RSI = 100 - (100 / (1 + RS))
-        where RS = Average Gain / Average Loss
+        where RS = Average Gain / Average Loss, smoothed with Wilder's method
 
         Args:
-            prices: Series of closing prices
+            prices: Closing prices, oldest first (a pandas Series also works)
             period: RSI period (uses instance default if not provided)
 
         Returns:
@@ -48,21 +67,13 @@ class TechnicalIndicatorCalculator:
                 f"Need at least {period + 1} data points, got {len(prices)}"
             )
 
-        # Calculate price changes
-        delta = prices.diff()
-
-        # Separate gains and losses
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        # Calculate RS and RSI
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        closes = np.ascontiguousarray(prices, dtype=np.float64)
+        if period == DEFAULT_RSI_PERIOD:
+            current_rsi = wilder_rsi14(closes)
+        else:
+            current_rsi = wilder_rsi(closes, period)
 
-        # Return the most recent RSI value
-        current_rsi = rsi.iloc[-1]
-
-        if pd.isna(current_rsi):
+        if np.isnan(current_rsi):
             raise ValueError("RSI calculation resulted in NaN")
 
         return round(float(current_rsi), 2)
@@ -74,7 +85,7 @@ class TechnicalIndicatorCalculator:
         interval: str = "1d"
     ) -> Optional[pd.DataFrame]:
         """
-        Fetch stock data from yfinance.
+        Fetch stock data from Yahoo Finance.
 
         Args:
             ticker: Stock symbol (e.g., 'AAPL')
@@ -82,29 +93,78 @@ class TechnicalIndicatorCalculator:
             interval: Data interval (e.g., '1d', '1h')
 
         Returns:
-            DataFrame with stock data or None if fetch fails
+            DataFrame with Close and Volume columns indexed by bar time, or
+            None if the fetch fails. Results are
+            cached for 15 minutes and shared between callers, so treat the
+            DataFrame as read-only.
         """
+        cache_key = (ticker.upper(), period, interval)
+        data = _history_cache.get(cache_key)
+        if data is not None:
+            logger.debug(f"Using cached data for {ticker}")
+            return data
+
+        return _history_fetches.run(cache_key, self._fetch_stock_data, *cache_key)
+
+    def _fetch_stock_data(
+        self,
+        ticker: str,
+        period: str,
+        interval: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        Download stock data and populate the history cache.
+
+        Reads Yahoo's chart endpoint directly (one request, Close and Volume
+        only) and falls back to yfinance if the request fails or the response
+        cannot be parsed. A ticker Yahoo does not know returns None without
+        retrying through yfinance.
+        """
+        try:
+            timestamps, closes, volumes = fetch_chart(ticker, period, interval)
+            data = pd.DataFrame(
+                {"Close": closes, "Volume": volumes},
+                index=pd.to_datetime(timestamps, unit="s", utc=True)
+            )
+        except TickerNotFoundError as e:
+            logger.error(f"No data returned for ticker {ticker}: {e}")
+            return None
+        except (requests.RequestException, KeyError, IndexError, TypeError, ValueError) as e:
+            logger.warning(f"Chart endpoint failed for {ticker}, falling back to yfinance: {e}")
+            data = None
+
         try:
-            stock = yf.Ticker(ticker)
-            data = stock.history(period=period, interval=interval)
+            if data is None:
+                # The chart endpoint serves unadjusted closes and both paths
+                # share a cache key, so ask yfinance for the same
+                data = get_ticker(ticker).history(
+                    period=period, interval=interval, auto_adjust=False
+                )
 
             if data.empty:
                 logger.error(f"No data returned for ticker {ticker}")
                 return None
 
             logger.info(f"Fetched {len(data)} data points for {ticker}")
+            _history_cache.set((ticker, period, interval), data)
             return data
 
         except Exception as e:
             logger.error(f"Error fetching data for {ticker}: {e}")
             return None
 
-    def analyze_ticker(self, ticker: str) -> Dict:
+    def analyze_ticker(
+        self,
+        ticker: str,
+        data: Optional[pd.DataFrame] = None
+    ) -> Dict:
         """
         Perform complete technical analysis on a ticker.
 
         Args:
             ticker: Stock symbol to analyze
+            data: Prefetched daily price history (e.g. one ticker's slice of a
+                batched yf.download); fetched from yfinance if not provided
 
         Returns:
             Dictionary containing:
@@ -116,12 +176,16 @@ class TechnicalIndicatorCalculator:
                 - error: Error message if status is 'error'
         """
         try:
-            # Fetch data - need enough for RSI calculation
-            data = self.get_stock_data(
-                ticker,
-                period="60d",  # Get 60 days to ensure enough for RSI
-                interval="1d"
-            )
+            if data is None:
+                # Fetch data - need enough for RSI calculation
+                data = self.get_stock_data(
+                    ticker,
+                    period="60d",  # Get 60 days to ensure enough for RSI
+                    interval="1d"
+                )
+            else:
+                # Batched downloads pad missing sessions with NaN rows
+                data = data.dropna(subset=["Close"])
 
             if data is None or data.empty:
                 return {
@@ -129,9 +193,12 @@ class TechnicalIndicatorCalculator:
                     "error": f"Unable to fetch data for ticker {ticker}"
                 }
 
+            closes = data['Close'].to_numpy(dtype=np.float64, copy=False)
+            volumes = data['Volume'].to_numpy(copy=False)
+
             # Calculate RSI
             try:
-                rsi = self.calculate_rsi(data['Close'])
+                rsi = self.calculate_rsi(closes)
             except ValueError as e:
                 logger.error(f"RSI calculation error: {e}")
                 return {
@@ -140,9 +207,9 @@ class TechnicalIndicatorCalculator:
                 }
 
             # Get current volume and price
-            current_volume = int(data['Volume'].iloc[-1])
-            current_price = round(float(data['Close'].iloc[-1]), 2)
-            avg_volume = int(data['Volume'].mean())
+            current_volume = int(volumes[-1])
+            current_price = round(float(closes[-1]), 2)
+            avg_volume = int(volumes.mean())
 
             logger.info(
                 f"Technical analysis for {ticker}: "
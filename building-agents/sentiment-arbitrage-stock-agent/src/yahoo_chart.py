@@ -0,0 +1,87 @@
+"""
+Yahoo Chart Module
+
+Fetches closing prices and volume straight from Yahoo Finance's chart
+endpoint with a single HTTP request, and holds the keep-alive session
+shared by every Yahoo Finance call in the service.
+"""
+
+from typing import Tuple
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# Keep-alive session shared by every Yahoo Finance call, so repeat requests
+# reuse pooled TLS connections instead of handshaking each time
+yahoo_session = requests.Session()
+yahoo_session.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+yahoo_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
+
+class TickerNotFoundError(ValueError):
+    """Raised when Yahoo reports that a symbol does not exist or has no bars."""
+
+
+def fetch_chart(
+    ticker: str,
+    period: str = "60d",
+    interval: str = "1d"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fetch bar timestamps, closing prices and volume for a ticker.
+
+    Bars without a closing price (e.g. a session still forming) are dropped,
+    and missing volume is reported as 0.
+
+    Args:
+        ticker: Stock symbol (e.g., 'AAPL')
+        period: Chart range (e.g., '60d', '3mo', '1y')
+        interval: Bar interval (e.g., '1d', '1h')
+
+    Returns:
+        Tuple of (timestamps, closes, volumes) arrays, oldest first;
+        timestamps are Unix seconds
+
+    Raises:
+        TickerNotFoundError: If Yahoo does not know the ticker or has no
+            bars for it
+        requests.RequestException: If the HTTP request fails
+        ValueError: If Yahoo returns any other error or a malformed chart
+    """
+    response = yahoo_session.get(
+        YAHOO_CHART_URL.format(ticker=ticker),
+        params={"range": period, "interval": interval},
+        timeout=10
+    )
+    # Unknown symbols come back as a 404 with a "Not Found" chart error
+    if response.status_code == 404:
+        raise TickerNotFoundError(f"Yahoo has no chart for {ticker}")
+    response.raise_for_status()
+    chart = response.json()["chart"]
+
+    error = chart.get("error")
+    if error and error.get("code") == "Not Found":
+        raise TickerNotFoundError(f"Yahoo has no chart for {ticker}: {error}")
+    if error or not chart.get("result"):
+        raise ValueError(f"Yahoo chart error for {ticker}: {error}")
+
+    result = chart["result"][0]
+    quote = result["indicators"]["quote"][0]
+    timestamps = np.asarray(result.get("timestamp") or [], dtype=np.int64)
+    # None entries become NaN with a float dtype
+    closes = np.asarray(quote.get("close") or [], dtype=np.float64)
+    volumes = np.asarray(quote.get("volume") or [], dtype=np.float64)
+
+    if timestamps.size == 0:
+        raise TickerNotFoundError(f"Yahoo chart returned no bars for {ticker}")
+    if not (timestamps.size == closes.size == volumes.size):
+        raise ValueError(f"Yahoo chart returned mismatched bars for {ticker}")
+
+    has_close = ~np.isnan(closes)
+    volumes = np.nan_to_num(volumes[has_close], nan=0.0).astype(np.int64)
+    return timestamps[has_close], closes[has_close], volumes
@@ -0,0 +1,23 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src import cache
+
+
+class FakeClock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the cache clock; advance it by adding to clock.now."""
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
@@ -0,0 +1,284 @@
+"""Tests for the Flask API routes, with Yahoo mocked out."""
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from src import api
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    api._validation_cache.clear()
+    yield
+    api._validation_cache.clear()
+
+
+def yahoo_response(payload, status_code=200):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} error")
+    return response
+
+
+def chart_ok():
+    return yahoo_response({
+        "chart": {
+            "result": [{
+                "timestamp": [1700000000, 1700086400],
+                "indicators": {"quote": [{"close": [1.0, 2.0], "volume": [10, 20]}]},
+            }],
+            "error": None,
+        }
+    })
+
+
+def chart_not_found():
+    # Body Yahoo sends with its 404 for an unknown symbol
+    return yahoo_response({
+        "chart": {
+            "result": None,
+            "error": {
+                "code": "Not Found",
+                "description": "No data found, symbol may be delisted",
+            },
+        }
+    }, status_code=404)
+
+
+@pytest.fixture
+def yahoo_get(monkeypatch):
+    get = mock.Mock()
+    monkeypatch.setattr(api.yahoo_session, "get", get)
+    return get
+
+
+def chart_calls(get):
+    return [c for c in get.call_args_list if "/v8/finance/chart/" in c.args[0]]
+
+
+def test_valid_ticker_is_cached_for_a_day(clock, yahoo_get):
+    yahoo_get.return_value = chart_ok()
+
+    assert api.check_ticker("AAPL") is True
+    assert yahoo_get.call_count == 1
+    assert yahoo_get.call_args.args[0].endswith("/v8/finance/chart/AAPL")
+    assert yahoo_get.call_args.kwargs["params"] == {"range": "5d", "interval": "1d"}
+
+    clock.now += 23 * 60 * 60
+    assert api.check_ticker("AAPL") is True
+    assert yahoo_get.call_count == 1
+
+
+def test_invalid_ticker_is_rechecked_after_short_ttl(clock, yahoo_get):
+    yahoo_get.return_value = chart_not_found()
+
+    assert api.check_ticker("NOPE") is False
+    assert api.check_ticker("NOPE") is False
+    assert yahoo_get.call_count == 1
+
+    clock.now += api.INVALID_TICKER_TTL_SECONDS
+    yahoo_get.return_value = chart_ok()
+    assert api.check_ticker("NOPE") is True
+    assert yahoo_get.call_count == 2
+
+
+@pytest.mark.parametrize("error_response", [
+    requests.ConnectionError("connection reset"),
+    yahoo_response({}, status_code=429),
+    yahoo_response({}, status_code=503),
+])
+def test_fetch_error_is_not_cached(yahoo_get, error_response):
+    if isinstance(error_response, Exception):
+        yahoo_get.side_effect = error_response
+    else:
+        yahoo_get.return_value = error_response
+
+    with pytest.raises(requests.RequestException):
+        api.check_ticker("AAPL")
+    assert api._validation_cache.get("AAPL") is None
+
+    response = api.app.test_client().get("/api/validate/AAPL")
+    assert response.status_code == 404
+    assert "reason" in response.get_json()
+    assert yahoo_get.call_count == 2
+
+
+def spark_response(payload):
+    response = mock.Mock()
+    response.json.return_value = payload
+    return response
+
+
+def test_validate_batch_classifies_spark_symbols(clock, yahoo_get):
+    yahoo_get.return_value = spark_response({
+        "AAPL": {"symbol": "AAPL", "close": [190.1, 190.4]},
+        "XYZ123": {"symbol": "XYZ123", "close": None},
+    })
+
+    response = api.app.test_client().post(
+        "/api/validate-batch", json={"tickers": ["aapl", "XYZ123", "AAPL"]}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["results"] == [
+        {"ticker": "AAPL", "valid": True},
+        {"ticker": "XYZ123", "valid": False},
+        {"ticker": "AAPL", "valid": True},
+    ]
+    assert yahoo_get.call_count == 1
+    assert not chart_calls(yahoo_get)
+
+    # The negative from spark also expires after the short TTL
+    clock.now += api.INVALID_TICKER_TTL_SECONDS
+    assert api._validation_cache.get("XYZ123") is None
+    assert api._validation_cache.get("AAPL") is True
+
+
+@pytest.mark.parametrize("payload", [
+    {"spark": {"result": [{"symbol": "AAPL"}], "error": None}},
+    {"finance": {"result": None, "error": {"code": "Bad Request"}}},
+    [],
+])
+def test_validate_batch_falls_back_on_unexpected_shape(yahoo_get, payload):
+    yahoo_get.side_effect = lambda url, **kwargs: (
+        chart_not_found() if url.endswith("/MSFT") else
+        chart_ok() if "/v8/finance/chart/" in url else
+        spark_response(payload)
+    )
+
+    response = api.app.test_client().post("/api/validate-batch", json={"tickers": ["AAPL", "MSFT"]})
+
+    assert response.get_json()["results"] == [
+        {"ticker": "AAPL", "valid": True},
+        {"ticker": "MSFT", "valid": False},
+    ]
+    assert len(chart_calls(yahoo_get)) == 2
+
+
+@pytest.mark.parametrize("body", [["AAPL"], "AAPL", {"tickers": []}, {"tickers": "AAPL"}])
+def test_validate_batch_rejects_malformed_payload(yahoo_get, body):
+    response = api.app.test_client().post("/api/validate-batch", json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "tickers must be a non-empty list"
+    yahoo_get.assert_not_called()
+
+
+@pytest.fixture
+def stock_data(monkeypatch):
+    rng = np.random.default_rng(7)
+    prices = pd.DataFrame({
+        "Close": 100.0 + np.cumsum(rng.normal(0, 1, 60)),
+        "Volume": np.arange(60) + 1000,
+    })
+    get = mock.Mock(return_value=prices)
+    monkeypatch.setattr(api.signal_generator.technical_calculator, "get_stock_data", get)
+    api.signal_generator._signal_cache.clear()
+    yield get
+    api.signal_generator._signal_cache.clear()
+
+
+def batch_items(*tickers):
+    return [{"ticker": ticker, "reddit_posts": ["Great stock!"]} for ticker in tickers]
+
+
+def test_signal_batch_returns_results_in_item_order(stock_data):
+    tickers = ["msft", "AAPL", "TSLA", "NVDA", "AMZN"]
+
+    response = api.app.test_client().post(
+        "/api/signal/batch", json={"items": batch_items(*tickers)}
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    results = response.get_json()
+    assert [result["ticker"] for result in results] == [t.upper() for t in tickers]
+    assert all("reason" in result for result in results)
+    assert stock_data.call_count == len(tickers)
+
+
+def test_signal_batch_terse_drops_reason(stock_data):
+    response = api.app.test_client().post(
+        "/api/signal/batch?terse=1", json={"items": batch_items("AAPL", "MSFT")}
+    )
+
+    assert response.status_code == 200
+    assert all("reason" not in result for result in response.get_json())
+
+
+@pytest.mark.parametrize("body", [
+    [{"ticker": "AAPL", "reddit_posts": ["Great stock!"]}],
+    {"items": []},
+    {"items": {"ticker": "AAPL"}},
+])
+def test_signal_batch_rejects_malformed_payload(stock_data, body):
+    response = api.app.test_client().post("/api/signal/batch", json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "items must be a non-empty list"
+    stock_data.assert_not_called()
+
+
+@pytest.mark.parametrize("bad_item, error", [
+    ("AAPL", "items[1]: item must be an object"),
+    ({"ticker": "MSFT"}, "items[1]: Missing required field: reddit_posts"),
+])
+def test_signal_batch_rejects_bad_item(stock_data, bad_item, error):
+    items = batch_items("AAPL") + [bad_item]
+
+    response = api.app.test_client().post("/api/signal/batch", json={"items": items})
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == error
+    stock_data.assert_not_called()
+
+
+def test_signal_batch_enforces_item_limit(monkeypatch, stock_data):
+    monkeypatch.setattr(api, "MAX_BATCH_ITEMS", 2)
+
+    response = api.app.test_client().post(
+        "/api/signal/batch", json={"items": batch_items("AAPL", "MSFT", "TSLA")}
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "items cannot contain more than 2 entries"
+    stock_data.assert_not_called()
+
+
+@pytest.mark.parametrize("path", ["/api/signal", "/api/signal/batch", "/api/validate-batch"])
+def test_malformed_json_body_is_a_json_400(yahoo_get, path):
+    response = api.app.test_client().post(
+        path, data=b'{"ticker": "AAPL",', content_type="application/json"
+    )
+
+    assert response.status_code == 400
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {
+        "status": "error",
+        "error": "Request body must be valid JSON",
+    }
+    yahoo_get.assert_not_called()
+
+
+def test_jsonify_serializes_numpy_scalars_and_arrays():
+    with api.app.app_context():
+        response = api.jsonify({
+            "rsi": np.float64(31.25),
+            "volume": np.int64(1200),
+            "closes": np.array([1.5, 2.5]),
+            1: "non-string key",
+        })
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {
+        "rsi": 31.25,
+        "volume": 1200,
+        "closes": [1.5, 2.5],
+        "1": "non-string key",
+    }
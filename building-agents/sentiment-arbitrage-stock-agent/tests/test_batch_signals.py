@@ -0,0 +1,59 @@
+"""Regression tests for process-pool batch signal generation."""
+
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+BATCH_SCRIPT = textwrap.dedent("""
+    import numpy as np
+    import pandas as pd
+
+    from src.signal_generator import batch_signals
+
+    if __name__ == "__main__":
+        prices = pd.DataFrame({
+            "Close": 100.0 + np.cumsum(np.random.default_rng(0).normal(0, 1, 60)),
+            "Volume": np.arange(60) + 1000,
+        })
+        posts = ["Great stock, buying more!"] * 600
+        results = batch_signals([("AAPL", posts)], {"AAPL": prices}, max_workers=1)
+        details = results[0]["metadata"]["sentiment_details"]
+        print(results[0]["status"], details["valid_posts"])
+""")
+
+
+def test_large_post_batch_in_worker_does_not_hang(tmp_path):
+    # Report several CPUs in every spawned interpreter so the batch worker
+    # takes the large-batch path that used to start a nested scoring pool
+    (tmp_path / "sitecustomize.py").write_text("import os\nos.cpu_count = lambda: 4\n")
+    script = tmp_path / "run_batch.py"
+    script.write_text(BATCH_SCRIPT)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(tmp_path), str(PROJECT_ROOT), env.get("PYTHONPATH", "")]
+    )
+    # Own process group, so a hang can be cleaned up along with its workers
+    process = subprocess.Popen(
+        [sys.executable, str(script)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=180)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.communicate()
+        raise AssertionError("batch_signals did not finish within 180s")
+
+    assert process.returncode == 0, stderr
+    assert stdout.split() == ["success", "600"]
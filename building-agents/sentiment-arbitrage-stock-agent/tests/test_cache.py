@@ -0,0 +1,130 @@
+"""Tests for the TTL cache and request coalescer."""
+
+import threading
+import time
+
+from src import cache
+from src.cache import RequestCoalescer, TTLCache
+
+
+def test_entry_expires_after_ttl(clock):
+    ttl_cache = TTLCache(ttl_seconds=60)
+    ttl_cache.set("AAPL", 1)
+
+    clock.now += 59
+    assert ttl_cache.get("AAPL") == 1
+
+    clock.now += 1
+    assert ttl_cache.get("AAPL") is None
+    assert len(ttl_cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    ttl_cache = TTLCache(ttl_seconds=60)
+    ttl_cache.set("short", 1, ttl_seconds=5)
+    ttl_cache.set("default", 2)
+
+    clock.now += 5
+    assert ttl_cache.get("short") is None
+    assert ttl_cache.get("default") == 2
+
+
+def test_get_returns_default_on_miss():
+    ttl_cache = TTLCache(ttl_seconds=60)
+    assert ttl_cache.get("missing", "fallback") == "fallback"
+
+
+def test_least_recently_used_entry_is_evicted():
+    ttl_cache = TTLCache(ttl_seconds=60, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+    assert len(ttl_cache) == 2
+
+
+def test_clear_removes_all_entries():
+    ttl_cache = TTLCache(ttl_seconds=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.clear()
+    assert len(ttl_cache) == 0
+
+
+def test_digest_key_is_stable_and_distinguishes_values():
+    assert cache.digest_key(["a", "b"]) == cache.digest_key(["a", "b"])
+    assert cache.digest_key(["a", "b"]) != cache.digest_key(["b", "a"])
+
+
+def test_coalescer_returns_result_and_cleans_up():
+    coalescer = RequestCoalescer()
+    assert coalescer.run("key", lambda x: x * 2, 21) == 42
+    assert coalescer._inflight == {}
+
+
+def test_concurrent_callers_share_one_call():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "data"
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(coalescer.run("k", slow_fetch)))
+    owner.start()
+    started.wait(5)
+
+    joiner = threading.Thread(target=lambda: results.append(coalescer.run("k", slow_fetch)))
+    joiner.start()
+    while coalescer.deduped == 0:
+        time.sleep(0.001)
+    release.set()
+    owner.join(5)
+    joiner.join(5)
+
+    assert results == ["data", "data"]
+    assert len(calls) == 1
+    assert coalescer._inflight == {}
+
+
+def test_exception_reaches_every_caller_and_key_is_released():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_fetch():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    errors = []
+
+    def call():
+        try:
+            coalescer.run("k", failing_fetch)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    owner = threading.Thread(target=call)
+    owner.start()
+    started.wait(5)
+    joiner = threading.Thread(target=call)
+    joiner.start()
+    while coalescer.deduped == 0:
+        time.sleep(0.001)
+    release.set()
+    owner.join(5)
+    joiner.join(5)
+
+    assert errors == ["upstream down", "upstream down"]
+    assert coalescer._inflight == {}
+    # A later call runs fresh instead of replaying the failure
+    assert coalescer.run("k", lambda: "recovered") == "recovered"
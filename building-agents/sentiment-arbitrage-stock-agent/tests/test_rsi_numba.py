@@ -0,0 +1,66 @@
+"""Tests for the Numba Wilder RSI kernels."""
+
+import numpy as np
+import pytest
+
+from src.rsi_numba import wilder_rsi, wilder_rsi14
+
+
+def reference_wilder_rsi(closes, period):
+    """Plain-Python Wilder RSI: SMA seed, then (avg * (n - 1) + x) / n smoothing."""
+    deltas = [b - a for a, b in zip(closes, closes[1:])]
+    gains = [max(d, 0.0) for d in deltas]
+    losses = [max(-d, 0.0) for d in deltas]
+
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(42)
+    return 100.0 + np.cumsum(rng.normal(0.0, 1.5, 60))
+
+
+@pytest.mark.parametrize("period", [2, 5, 14, 30])
+def test_matches_reference(closes, period):
+    expected = reference_wilder_rsi(list(closes), period)
+    assert wilder_rsi(closes, period) == pytest.approx(expected, rel=1e-9)
+
+
+def test_period_14_specialization_matches_generic(closes):
+    assert wilder_rsi14(closes) == pytest.approx(wilder_rsi(closes, 14), rel=1e-12)
+
+
+def test_specialization_accepts_read_only_arrays(closes):
+    closes.flags.writeable = False
+    assert wilder_rsi14(closes) == pytest.approx(reference_wilder_rsi(list(closes), 14), rel=1e-9)
+
+
+def test_minimum_length_uses_seed_average_only():
+    closes = np.array([10.0, 11.0, 10.5, 11.5])
+    # gains 1.0 + 1.0, losses 0.5 over period 3
+    expected = 100.0 - 100.0 / (1.0 + (2.0 / 3) / (0.5 / 3))
+    assert wilder_rsi(closes, 3) == pytest.approx(expected)
+
+
+def test_flat_series_is_nan():
+    closes = np.full(30, 50.0)
+    assert np.isnan(wilder_rsi(closes, 14))
+    assert np.isnan(wilder_rsi14(closes))
+
+
+def test_series_without_losses_is_100():
+    closes = np.arange(1.0, 31.0)
+    assert wilder_rsi(closes, 14) == 100.0
+    assert wilder_rsi14(closes) == 100.0
+
+
+def test_series_without_gains_is_0():
+    closes = np.arange(30.0, 0.0, -1.0)
+    assert wilder_rsi14(closes) == 0.0
@@ -0,0 +1,93 @@
+"""Tests for sentiment scoring and aggregation."""
+
+import pytest
+from textblob import TextBlob
+
+from src import sentiment_analyzer
+from src.sentiment_analyzer import MAX_CACHED_TEXT_CHARS, SentimentAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def clear_score_cache():
+    sentiment_analyzer._score_cached.cache_clear()
+    yield
+    sentiment_analyzer._score_cached.cache_clear()
+
+
+def test_scores_match_textblob():
+    analyzer = SentimentAnalyzer()
+    for text in ["This is amazing!", "Terrible earnings, selling", "Holding for now"]:
+        assert analyzer.analyze_text(text) == TextBlob(text).sentiment.polarity
+
+
+def test_blank_text_scores_zero():
+    analyzer = SentimentAnalyzer()
+    assert analyzer.analyze_text("") == 0.0
+    assert analyzer.analyze_text("   ") == 0.0
+
+
+def test_short_texts_are_memoized():
+    analyzer = SentimentAnalyzer()
+    analyzer.analyze_text("Great stock!")
+    analyzer.analyze_text("Great stock!")
+
+    info = sentiment_analyzer._score_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_long_texts_bypass_the_cache():
+    analyzer = SentimentAnalyzer()
+    long_text = "Great stock! " * (MAX_CACHED_TEXT_CHARS // 10)
+    assert len(long_text) > MAX_CACHED_TEXT_CHARS
+
+    assert analyzer.analyze_text(long_text) == TextBlob(long_text).sentiment.polarity
+    assert sentiment_analyzer._score_cached.cache_info().currsize == 0
+
+
+def test_aggregate_counts_blank_posts():
+    result = SentimentAnalyzer().aggregate_sentiment(["Great stock!", "", "   ", "Terrible"])
+    assert result["num_texts"] == 4
+    assert result["valid_texts"] == 2
+
+
+def test_aggregate_of_nothing_is_neutral():
+    analyzer = SentimentAnalyzer()
+    for texts in ([], iter([]), ["", " "]):
+        result = analyzer.aggregate_sentiment(texts)
+        assert result["normalized_score"] == 0.5
+        assert result["valid_texts"] == 0
+
+
+def test_aggregate_is_independent_of_container_type(monkeypatch):
+    # Keep the large-list path in-process while still taking its code path
+    monkeypatch.setattr(sentiment_analyzer, "_pool_workers", lambda: 1)
+    # A mix whose pairwise and running float sums round differently at 4 decimals
+    words = ["great", "good", "awful", "fine", "amazing", "bad", "meh", "nice",
+             "terrible", "happy", "sad", "best", "worst", "ok", "cool"]
+    posts = [f"{words[(i * 14) % 15]} {words[(i * i + 14) % 15]} stock" for i in range(1100)]
+
+    analyzer = SentimentAnalyzer()
+    results = [
+        analyzer.aggregate_sentiment(posts),
+        analyzer.aggregate_sentiment(tuple(posts)),
+        analyzer.aggregate_sentiment(iter(posts)),
+    ]
+    assert results[0] == results[1] == results[2]
+    assert results[0]["num_texts"] == 1100
+
+
+@pytest.mark.parametrize("env, cpus, expected", [
+    ({}, 8, 8),
+    ({"GUNICORN_WORKERS": "4"}, 8, 2),
+    ({"GUNICORN_WORKERS": "16"}, 8, 1),
+    ({"GUNICORN_WORKERS": "4", "SENTIMENT_POOL_WORKERS": "3"}, 8, 3),
+    ({}, None, 1),
+])
+def test_pool_is_sized_per_server_worker(monkeypatch, env, cpus, expected):
+    monkeypatch.delenv("GUNICORN_WORKERS", raising=False)
+    monkeypatch.delenv("SENTIMENT_POOL_WORKERS", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(sentiment_analyzer.os, "cpu_count", lambda: cpus)
+
+    assert sentiment_analyzer._pool_workers() == expected
@@ -0,0 +1,76 @@
+"""Tests for signal generation with market data mocked out."""
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.signal_generator import SignalGenerator
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        "Close": 100.0 + np.cumsum(rng.normal(0, 1, 60)),
+        "Volume": np.arange(60) + 1000,
+    })
+
+
+@pytest.fixture
+def generator():
+    return SignalGenerator()
+
+
+@pytest.fixture(autouse=True)
+def get_stock_data(generator, prices):
+    with mock.patch.object(
+        generator.technical_calculator, "get_stock_data", return_value=prices
+    ) as patched:
+        yield patched
+
+
+def test_repeat_request_is_served_from_cache(generator, get_stock_data):
+    first = generator.generate_signal("aapl", ["Great stock!"])
+    second = generator.generate_signal("AAPL", ["Great stock!"])
+
+    assert get_stock_data.call_count == 1
+    assert second["signal"] == first["signal"]
+    assert second["metadata"] == first["metadata"]
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache(generator):
+    first = generator.generate_signal("AAPL", ["Great stock!"])
+    expected = first["metadata"]["sentiment_details"]["valid_posts"]
+    first["metadata"]["sentiment_details"]["valid_posts"] = -1
+
+    second = generator.generate_signal("AAPL", ["Great stock!"])
+    assert second["metadata"]["sentiment_details"]["valid_posts"] == expected
+
+    second["metadata"]["technical_details"]["avg_volume"] = -1
+    third = generator.generate_signal("AAPL", ["Great stock!"])
+    assert third["metadata"]["technical_details"]["avg_volume"] != -1
+    assert third["metadata"] is not second["metadata"]
+
+
+@pytest.mark.parametrize("sentiment, rsi, expected", [
+    (0.8, 20.0, "BUY"),
+    (0.8, 50.0, "HOLD"),
+    (0.3, 20.0, "HOLD"),
+    (0.3, 50.0, "NEUTRAL"),
+])
+def test_determine_signal_branches(generator, sentiment, rsi, expected):
+    signal, reason = generator.determine_signal(sentiment, rsi)
+    assert signal == expected
+    assert reason
+
+    assert generator.determine_signal(sentiment, rsi, include_reason=False) == (expected, None)
+
+
+def test_determine_signal_options_are_keyword_only(generator):
+    with pytest.raises(TypeError):
+        generator.determine_signal(0.3, 50.0, False)
+
+    signal, _ = generator.determine_signal(0.3, 50.0, sentiment_threshold=0.2, rsi_buy_threshold=60)
+    assert signal == "BUY"
@@ -0,0 +1,74 @@
+"""Tests for how price history fetches fall back between chart and yfinance."""
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from src import technical_indicators
+from src.technical_indicators import TechnicalIndicatorCalculator
+from src.yahoo_chart import TickerNotFoundError
+
+
+@pytest.fixture(autouse=True)
+def clear_history_cache():
+    technical_indicators._history_cache.clear()
+    yield
+    technical_indicators._history_cache.clear()
+
+
+@pytest.fixture
+def history(monkeypatch):
+    ticker = mock.Mock()
+    monkeypatch.setattr(technical_indicators, "get_ticker", lambda symbol: ticker)
+    return ticker.history
+
+
+def fail_chart(monkeypatch, error):
+    monkeypatch.setattr(
+        technical_indicators, "fetch_chart", mock.Mock(side_effect=error)
+    )
+
+
+def test_chart_bars_become_a_dataframe(monkeypatch, history):
+    monkeypatch.setattr(
+        technical_indicators,
+        "fetch_chart",
+        lambda *args: (
+            np.array([86400, 172800], dtype=np.int64),
+            np.array([10.0, 11.0]),
+            np.array([100, 200], dtype=np.int64),
+        ),
+    )
+
+    data = TechnicalIndicatorCalculator().get_stock_data("AAPL")
+
+    assert list(data["Close"]) == [10.0, 11.0]
+    assert list(data["Volume"]) == [100, 200]
+    assert str(data.index.tz) == "UTC"
+    history.assert_not_called()
+
+
+def test_unknown_ticker_returns_none_without_fallback(monkeypatch, history):
+    fail_chart(monkeypatch, TickerNotFoundError("no chart"))
+
+    assert TechnicalIndicatorCalculator().get_stock_data("NOPE") is None
+    history.assert_not_called()
+
+
+@pytest.mark.parametrize("error", [
+    requests.ConnectionError("reset"),
+    requests.HTTPError("503 error"),
+    KeyError("chart"),
+    ValueError("mismatched bars"),
+])
+def test_transport_and_parse_errors_fall_back_unadjusted(monkeypatch, history, error):
+    fail_chart(monkeypatch, error)
+    history.return_value = pd.DataFrame({"Close": [10.0], "Volume": [100]})
+
+    data = TechnicalIndicatorCalculator().get_stock_data("AAPL")
+
+    assert list(data["Close"]) == [10.0]
+    history.assert_called_once_with(period="60d", interval="1d", auto_adjust=False)
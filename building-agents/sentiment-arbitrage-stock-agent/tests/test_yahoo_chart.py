@@ -0,0 +1,112 @@
+"""Tests for the Yahoo chart endpoint client, using a mocked session."""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+import requests
+
+from src import yahoo_chart
+
+
+def chart_response(payload, status_code=200):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} error")
+    return response
+
+
+def chart_payload(timestamps, closes, volumes):
+    return {
+        "chart": {
+            "result": [{
+                "timestamp": timestamps,
+                "indicators": {"quote": [{"close": closes, "volume": volumes}]},
+            }],
+            "error": None,
+        }
+    }
+
+
+@pytest.fixture
+def session_get(monkeypatch):
+    get = mock.Mock()
+    monkeypatch.setattr(yahoo_chart.yahoo_session, "get", get)
+    return get
+
+
+def test_parses_bars_and_requests_range(session_get):
+    session_get.return_value = chart_response(
+        chart_payload([100, 200, 300], [10.0, 11.5, 12.0], [1000, 2000, 3000])
+    )
+
+    timestamps, closes, volumes = yahoo_chart.fetch_chart("AAPL", period="60d", interval="1d")
+
+    np.testing.assert_array_equal(timestamps, [100, 200, 300])
+    np.testing.assert_array_equal(closes, [10.0, 11.5, 12.0])
+    np.testing.assert_array_equal(volumes, [1000, 2000, 3000])
+    assert closes.dtype == np.float64
+    assert volumes.dtype == np.int64
+
+    url = session_get.call_args.args[0]
+    assert url.endswith("/v8/finance/chart/AAPL")
+    assert session_get.call_args.kwargs["params"] == {"range": "60d", "interval": "1d"}
+
+
+def test_drops_bars_with_null_close(session_get):
+    session_get.return_value = chart_response(
+        chart_payload([100, 200, 300, 400], [10.0, None, 12.0, None], [1000, 2000, None, 4000])
+    )
+
+    timestamps, closes, volumes = yahoo_chart.fetch_chart("AAPL")
+
+    np.testing.assert_array_equal(timestamps, [100, 300])
+    np.testing.assert_array_equal(closes, [10.0, 12.0])
+    # A missing volume on a kept bar is reported as 0
+    np.testing.assert_array_equal(volumes, [1000, 0])
+
+
+NOT_FOUND_BODY = {
+    "chart": {
+        "result": None,
+        "error": {
+            "code": "Not Found",
+            "description": "No data found, symbol may be delisted",
+        },
+    }
+}
+
+
+def test_unknown_ticker_raises_not_found(session_get):
+    session_get.return_value = chart_response(NOT_FOUND_BODY, status_code=404)
+    with pytest.raises(yahoo_chart.TickerNotFoundError):
+        yahoo_chart.fetch_chart("NOPE")
+
+
+def test_not_found_chart_error_raises_not_found(session_get):
+    session_get.return_value = chart_response(NOT_FOUND_BODY)
+    with pytest.raises(yahoo_chart.TickerNotFoundError):
+        yahoo_chart.fetch_chart("NOPE")
+
+
+def test_other_chart_error_raises_value_error(session_get):
+    session_get.return_value = chart_response(
+        {"chart": {"result": None, "error": {"code": "Bad Request"}}}
+    )
+    with pytest.raises(ValueError) as excinfo:
+        yahoo_chart.fetch_chart("AAPL", period="bogus")
+    assert not isinstance(excinfo.value, yahoo_chart.TickerNotFoundError)
+
+
+def test_empty_result_raises_not_found(session_get):
+    session_get.return_value = chart_response(chart_payload([], [], []))
+    with pytest.raises(yahoo_chart.TickerNotFoundError):
+        yahoo_chart.fetch_chart("AAPL")
+
+
+def test_server_error_raises_http_error(session_get):
+    session_get.return_value = chart_response({}, status_code=503)
+    with pytest.raises(requests.HTTPError):
+        yahoo_chart.fetch_chart("AAPL")